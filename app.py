@@ -1,38 +1,145 @@
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPalette, QColor
-from PyQt5.QtWidgets import QApplication
+from core.utils.startup_profiler import profiler
 
-from core.main_window import MainWindow
+from PyQt5.QtCore import Qt, QTimer
+
+
+def parse_args(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='app.py')
+    parser.add_argument(
+        '--profile-startup',
+        nargs='?',
+        const='',
+        metavar='TRACE_FILE',
+        help='Print startup phase timings; also write a Chrome trace JSON to TRACE_FILE if given'
+    )
+    parser.add_argument(
+        '--vault',
+        metavar='NAME',
+        help='Switch to the named vault; a running instance is told to switch instead'
+    )
+    parser.add_argument(
+        '--tray',
+        action='store_true',
+        help='Keep running in the system tray; start with the window hidden'
+    )
+    parser.add_argument(
+        '--quick',
+        action='store_true',
+        help='Open the Quick Retrieve popup (of the running instance, if any)'
+    )
+    parser.add_argument(
+        '--new-instance',
+        action='store_true',
+        help='Start a separate instance even if one is already running'
+    )
+    args, _ = parser.parse_known_args(argv[1:])
+    return args
+
+
+def apply_arguments(window, args):
+    if args.vault and args.vault != window.vaults.active:
+        if args.vault in window.vaults.names():
+            window.switch_vault(args.vault)
+        else:
+            window.show_status_message(f'Unknown vault "{args.vault}"', 5000)
+    if args.tray:
+        window.set_tray_mode(True)
+    if args.quick:
+        window.show_quick_retrieve()
+
+
+def on_instance_message(window, arguments):
+    args = parse_args(['app.py'] + arguments)
+    # The popup and tray requests come from shortcuts meant to stay out of
+    # the way; any other launch brings the window up.
+    if not args.quick and not args.tray:
+        window.bring_to_front()
+    apply_arguments(window, args)
+
+
+def finish_startup_profile(trace_file):
+    profiler.end('show -> first event loop pass')
+    print(profiler.report())
+    if trace_file:
+        profiler.write_chrome_trace(trace_file)
+        print(f'Chrome trace written to {trace_file}')
 
 
 def main():
     import sys
 
-    app = QApplication(sys.argv)
-
-    app.setStyle('Fusion')
-
-    dark_palette = QPalette()
-    dark_palette.setColor(QPalette.Window, QColor(30, 30, 30))
-    dark_palette.setColor(QPalette.WindowText, Qt.GlobalColor.white)
-    dark_palette.setColor(QPalette.Base, QColor(20, 20, 20))
-    dark_palette.setColor(QPalette.AlternateBase, QColor(40, 40, 40))
-    dark_palette.setColor(QPalette.ToolTipBase, QColor(50, 50, 50))
-    dark_palette.setColor(QPalette.ToolTipText, Qt.GlobalColor.white)
-    dark_palette.setColor(QPalette.Text, Qt.GlobalColor.white)
-    dark_palette.setColor(QPalette.Button, QColor(50, 50, 50))
-    dark_palette.setColor(QPalette.ButtonText, Qt.GlobalColor.white)
-    dark_palette.setColor(QPalette.BrightText, Qt.GlobalColor.red)
-    dark_palette.setColor(QPalette.Link, QColor(42, 130, 218))
-    dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-    dark_palette.setColor(QPalette.HighlightedText, Qt.GlobalColor.black)
-    dark_palette.setColor(QPalette.Disabled, QPalette.Text, QColor(100, 100, 100))
-    dark_palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(100, 100, 100))
-
-    app.setPalette(dark_palette)
-
-    window = MainWindow()
-    window.show()
+    args = parse_args(sys.argv)
+    if args.profile_startup is not None:
+        profiler.enable()
+        profiler.record('imports', profiler.origin)
+
+    # Profiling measures a cold start, so it never hands off.
+    single_instance = not args.new_instance and args.profile_startup is None
+    if single_instance:
+        from core.utils.single_instance import SingleInstanceServer, send_to_running_instance
+
+        if send_to_running_instance(sys.argv[1:]):
+            sys.exit(0)
+
+    # Imported only now, so that a hand-off does not pay for them.
+    with profiler.phase('import QtWidgets'):
+        from PyQt5.QtGui import QPalette, QColor
+        from PyQt5.QtWidgets import QApplication
+
+    with profiler.phase('QApplication'):
+        app = QApplication(sys.argv)
+
+    # Listen before the slow window setup, so that a launch in the meantime
+    # is queued here instead of starting a second instance.
+    instance_server = None
+    if single_instance:
+        instance_server = SingleInstanceServer(parent=app)
+        if not instance_server.listen():
+            # Another instance took the name since the first attempt.
+            if send_to_running_instance(sys.argv[1:]):
+                sys.exit(0)
+            instance_server = None
+
+    with profiler.phase('palette setup'):
+        app.setStyle('Fusion')
+
+        dark_palette = QPalette()
+        dark_palette.setColor(QPalette.Window, QColor(30, 30, 30))
+        dark_palette.setColor(QPalette.WindowText, Qt.GlobalColor.white)
+        dark_palette.setColor(QPalette.Base, QColor(20, 20, 20))
+        dark_palette.setColor(QPalette.AlternateBase, QColor(40, 40, 40))
+        dark_palette.setColor(QPalette.ToolTipBase, QColor(50, 50, 50))
+        dark_palette.setColor(QPalette.ToolTipText, Qt.GlobalColor.white)
+        dark_palette.setColor(QPalette.Text, Qt.GlobalColor.white)
+        dark_palette.setColor(QPalette.Button, QColor(50, 50, 50))
+        dark_palette.setColor(QPalette.ButtonText, Qt.GlobalColor.white)
+        dark_palette.setColor(QPalette.BrightText, Qt.GlobalColor.red)
+        dark_palette.setColor(QPalette.Link, QColor(42, 130, 218))
+        dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
+        dark_palette.setColor(QPalette.HighlightedText, Qt.GlobalColor.black)
+        dark_palette.setColor(QPalette.Disabled, QPalette.Text, QColor(100, 100, 100))
+        dark_palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(100, 100, 100))
+
+        app.setPalette(dark_palette)
+
+    with profiler.phase('import MainWindow'):
+        from core.main_window import MainWindow
+
+    with profiler.phase('MainWindow.__init__'):
+        window = MainWindow()
+
+    apply_arguments(window, args)
+    if instance_server is not None:
+        instance_server.message_received.connect(lambda arguments, cwd: on_instance_message(window, arguments))
+
+    if profiler.enabled:
+        profiler.begin('show -> first event loop pass')
+        QTimer.singleShot(0, lambda: finish_startup_profile(args.profile_startup))
+
+    if not window.tray_mode:
+        window.show()
     sys.exit(app.exec_())
 
 
@@ -0,0 +1,510 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+from smartpasslib import SmartPasswordManager, SmartPassword
+
+
+DEFAULT_SIZES = [100, 1000, 10000, 50000]
+DEFAULT_THRESHOLD = 10.0
+
+results = {}
+
+
+def make_public_key(number):
+    return f'{number:064x}'
+
+
+def make_manager(count, filename):
+    manager = SmartPasswordManager(filename)
+    for number in range(count):
+        public_key = make_public_key(number)
+        manager.passwords[public_key] = SmartPassword(
+            public_key=public_key,
+            description=f'Account {number}',
+            length=12 + number % 89
+        )
+    return manager
+
+
+def install_atomic_writes(manager):
+    from core.utils.binary_store import write_passwords
+
+    manager._write_data = lambda: write_passwords(manager.filename, manager.passwords)
+
+
+def measure(func, repeat=200):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def report(name, size, seconds, note=None):
+    # `note` is printed only, so that baseline keys stay the same when it
+    # changes.
+    results[f'{name} [{size}]'] = seconds
+    print(f'{name:<40} {size:>8} {seconds * 1e6:>14.2f} us' + (f'  ({note})' if note else ''))
+
+
+def save_baseline(filename):
+    with open(filename, 'w') as f:
+        json.dump(
+            {
+                "python": sys.version.split()[0],
+                "platform": sys.platform,
+                "results": results,
+            },
+            f,
+            indent=2,
+            sort_keys=True
+        )
+    print(f'Baseline written to {filename}')
+
+
+def format_result(key, value):
+    if key.startswith('memory:'):
+        return f'{value / 2 ** 20:.1f} MiB'
+    return f'{value * 1e6:.2f} us'
+
+
+def compare_baseline(filename, threshold):
+    with open(filename) as f:
+        baseline = json.load(f)["results"]
+
+    regressions = []
+    print()
+    print(f'{"Benchmark":<56} {"Baseline":>14} {"Current":>14} {"Change":>8}')
+    for key, value in results.items():
+        previous = baseline.get(key)
+        if not previous:
+            print(f'{key:<56} {"-":>14} {format_result(key, value):>14} {"new":>8}')
+            continue
+        change = (value - previous) / previous * 100
+        flag = ''
+        if change > threshold:
+            regressions.append(key)
+            flag = '  REGRESSION'
+        print(f'{key:<56} {format_result(key, previous):>14} {format_result(key, value):>14} {change:>+7.1f}%{flag}')
+
+    if regressions:
+        print(f'{len(regressions)} benchmark(s) worse than baseline by more than {threshold:g}%')
+    return not regressions
+
+
+def bench_edit_lookup(sizes, work_dir):
+    from core.models.password_table_model import PasswordTableModel
+
+    for size in sizes:
+        manager = make_manager(size, os.path.join(work_dir, f'edit_{size}.json'))
+        model = PasswordTableModel(manager)
+        public_key = make_public_key(size - 1)
+        report('edit: row lookup', size, measure(lambda: model.row_for_public_key(public_key)))
+        report('edit: lookup + dataChanged', size, measure(lambda: model.update_password(public_key)))
+
+
+def bench_batch_writes(sizes, work_dir, added=100):
+    from core.utils.metadata_batch import MetadataBatch
+
+    for size in sizes:
+        for batched in (False, True):
+            manager = make_manager(size, os.path.join(work_dir, f'batch_{size}_{batched}.json'))
+            install_atomic_writes(manager)
+            write_data = manager._write_data
+            writes = []
+            manager._write_data = lambda: (writes.append(1), write_data())
+            new_passwords = [
+                SmartPassword(public_key=make_public_key(size + number), description=f'New {number}', length=16)
+                for number in range(added)
+            ]
+
+            start = time.perf_counter()
+            if batched:
+                with MetadataBatch(manager) as batch:
+                    batch.add_smart_passwords(new_passwords)
+            else:
+                for smart_password in new_passwords:
+                    manager.add_smart_password(smart_password)
+            elapsed = time.perf_counter() - start
+
+            name = f'add {added}: {"batched" if batched else "per-entry"}'
+            report(name, size, elapsed, f'{len(writes)} writes')
+
+
+def bench_write_behind(sizes, work_dir, edits=50):
+    from core.utils.write_behind import install_write_behind
+
+    for size in sizes:
+        for deferred in (False, True):
+            manager = make_manager(size, os.path.join(work_dir, f'persist_{size}_{deferred}.json'))
+            if deferred:
+                writer = install_write_behind(manager)
+            else:
+                install_atomic_writes(manager)
+            public_key = make_public_key(0)
+
+            start = time.perf_counter()
+            for number in range(edits):
+                manager.update_smart_password(public_key, description=f'Edited {number}')
+            elapsed = (time.perf_counter() - start) / edits
+
+            if deferred:
+                writer.close()
+                report('edit: write-behind', size, elapsed, f'{writer.write_count} writes')
+            else:
+                report('edit: synchronous', size, elapsed, f'{edits} writes')
+
+
+def bench_store_open(sizes, work_dir):
+    from core.utils.binary_store import open_password_manager, write_binary_store
+
+    for size in sizes:
+        manager = make_manager(size, os.path.join(work_dir, f'store_{size}.json'))
+        manager._write_data()
+        store_filename = os.path.join(work_dir, f'store_{size}.bin')
+        write_binary_store(store_filename, manager.passwords)
+        public_key = make_public_key(size // 2)
+
+        report('open: JSON', size, measure(lambda: SmartPasswordManager(manager.filename), repeat=10))
+        report('open: binary store', size, measure(lambda: open_password_manager(store_filename), repeat=10))
+
+        def open_and_read_row():
+            passwords = open_password_manager(store_filename).passwords
+            return list(passwords), passwords[public_key]
+
+        report('open: binary store + keys + 1 row', size, measure(open_and_read_row, repeat=10))
+
+
+STARTUP_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from PyQt5.QtCore import QEvent, QObject
+from PyQt5.QtWidgets import QApplication
+app = QApplication(sys.argv)
+from core.main_window import MainWindow
+imported = time.perf_counter()
+window = MainWindow()
+constructed = time.perf_counter()
+
+class FirstPaint(QObject):
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint:
+            print(imported - start, constructed - start, time.perf_counter() - start)
+            app.exit()
+        return False
+
+first_paint = FirstPaint()
+window.table_view.viewport().installEventFilter(first_paint)
+window.show()
+app.exec_()
+"""
+
+
+MEMORY_SCRIPT = """
+import sys, tracemalloc
+tracemalloc.start()
+from PyQt5.QtWidgets import QApplication, QTableView
+app = QApplication(sys.argv)
+from core.models.password_filter_proxy_model import PasswordFilterProxyModel
+from core.models.password_table_model import PasswordTableModel
+from core.utils.binary_store import open_password_manager
+
+
+def rss():
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == 'darwin' else usage * 1024
+
+
+baseline_heap = tracemalloc.get_traced_memory()[0]
+baseline_rss = rss()
+manager = open_password_manager(sys.argv[1])
+model = PasswordTableModel(manager)
+proxy = PasswordFilterProxyModel()
+proxy.setSourceModel(model)
+view = QTableView()
+view.setModel(proxy)
+view.resize(800, 600)
+view.show()
+app.processEvents()
+print(tracemalloc.get_traced_memory()[0] - baseline_heap, rss() - baseline_rss)
+"""
+
+
+def bench_memory(sizes, work_dir):
+    import subprocess
+    from core.utils.binary_store import write_binary_store
+
+    for size in sizes:
+        manager = make_manager(size, os.path.join(work_dir, f'memory_{size}.json'))
+        manager._write_data()
+        store_filename = os.path.join(work_dir, f'memory_{size}.bin')
+        write_binary_store(store_filename, manager.passwords)
+
+        for label, filename in (('JSON', manager.filename), ('binary store', store_filename)):
+            output = subprocess.run(
+                [sys.executable, '-c', MEMORY_SCRIPT, filename],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                capture_output=True,
+                text=True,
+                check=True
+            ).stdout
+            heap, rss = (int(value) for value in output.split())
+            print(f'{"memory: " + label + " (heap / RSS)":<40} {size:>8} '
+                  f'{heap / 2 ** 20:>10.1f} MiB {rss / 2 ** 20:>10.1f} MiB')
+            results[f'memory: {label} heap [{size}]'] = heap
+            results[f'memory: {label} RSS [{size}]'] = rss
+
+
+def bench_startup(sizes, work_dir, repeat=5):
+    import subprocess
+
+    for size in sizes:
+        home = os.path.join(work_dir, f'home_{size}')
+        config_dir = os.path.join(home, '.config', 'smart_password_manager')
+        os.makedirs(config_dir, exist_ok=True)
+        make_manager(size, os.path.join(config_dir, 'passwords.json'))._write_data()
+
+        env = dict(os.environ, HOME=home)
+        timings = []
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, '-c', STARTUP_SCRIPT],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True
+            ).stdout
+            timings.append([float(value) for value in output.split()])
+
+        imported, constructed, painted = (statistics.median(column) for column in zip(*timings))
+        report('startup: imports', size, imported)
+        report('startup: MainWindow()', size, constructed)
+        report('startup: first paint', size, painted)
+        report('startup: hand-off to running instance', size, measure_handoff(home, env, repeat))
+
+
+def measure_handoff(home, env, repeat):
+    # A second `app.py` launch while this process plays the running instance.
+    import subprocess
+    from core.utils.single_instance import SingleInstanceServer
+
+    previous_home = os.environ.get('HOME')
+    os.environ['HOME'] = home
+    try:
+        server = SingleInstanceServer()
+    finally:
+        if previous_home is None:
+            del os.environ['HOME']
+        else:
+            os.environ['HOME'] = previous_home
+    server.listen()
+
+    app = QApplication.instance()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, 'app.py'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        while process.poll() is None:
+            app.processEvents()
+            time.sleep(0.001)
+        timings.append(time.perf_counter() - start)
+    server.close()
+    return statistics.median(timings)
+
+
+def bench_cli_throughput(sizes, work_dir):
+    import cli
+    from smartpasslib import SmartPasswordMaster
+
+    for size in sizes:
+        secrets = [f'benchmark secret phrase {number}' for number in range(size)]
+        entries = {}
+        for number, secret in enumerate(secrets):
+            public_key = SmartPasswordMaster.generate_public_key(secret)
+            entries[public_key] = SmartPassword(public_key=public_key, description=f'Account {number}', length=16)
+
+        for jobs in sorted({1, os.cpu_count() or 1}):
+            start = time.perf_counter()
+            results = list(cli.run(secrets, entries, jobs=jobs))
+            elapsed = time.perf_counter() - start
+            assert all(result["status"] == "ok" for result in results)
+            report(f'cli: {jobs} process(es)', size, elapsed)
+
+
+def bench_retrieval(sizes, work_dir, lengths=(12, 16, 32, 64, 100)):
+    from smartpasslib import SmartPasswordMaster
+    from core.utils.password_engine import expand_password, verify_secret
+
+    secret = 'benchmark secret phrase'
+    public_key = SmartPasswordMaster.generate_public_key(secret)
+
+    def two_pass(length):
+        if SmartPasswordMaster.check_public_key(secret=secret, public_key=public_key):
+            return SmartPasswordMaster.generate_smart_password(secret=secret, length=length)
+
+    def single_pass(length):
+        private_key = verify_secret(secret, public_key)
+        if private_key is not None:
+            return expand_password(private_key, length)
+
+    for length in lengths:
+        assert two_pass(length) == single_pass(length)
+        report('get: check + generate (length)', length, measure(lambda: two_pass(length)))
+        report('get: single pass (length)', length, measure(lambda: single_pass(length)))
+
+
+def bench_derivation(sizes, work_dir, lengths=(12, 16, 24, 32, 48, 64, 100)):
+    from smartpasslib import SmartPasswordMaster
+
+    secret = 'benchmark secret phrase'
+    report('derive: generate_public_key', 0, measure(lambda: SmartPasswordMaster.generate_public_key(secret)))
+    for length in lengths:
+        report(
+            'derive: generate_smart_password (length)',
+            length,
+            measure(lambda: SmartPasswordMaster.generate_smart_password(secret=secret, length=length))
+        )
+
+
+def bench_table_population(sizes, work_dir):
+    home = os.environ.get('HOME')
+    os.environ['HOME'] = os.path.join(work_dir, 'home_table')
+    try:
+        from PyQt5.QtCore import Qt
+        from core.main_window import MainWindow
+        from core.models.password_table_model import PasswordTableModel
+        window = MainWindow()
+    finally:
+        if home is None:
+            del os.environ['HOME']
+        else:
+            os.environ['HOME'] = home
+
+    for size in sizes:
+        manager = make_manager(size, os.path.join(work_dir, f'table_{size}.json'))
+        window.smart_pass_man.smart_passwords = manager.smart_passwords
+        report('table: MainWindow._init', size, measure(window._init, repeat=20))
+        window.show()
+        report('table: paint visible rows', size, measure(window.table_view.viewport().grab, repeat=20))
+
+        # Alternate the order so that every call actually re-sorts.
+        orders = [Qt.AscendingOrder, Qt.DescendingOrder]
+        for column, name in ((PasswordTableModel.DESCRIPTION_COLUMN, 'description'),
+                             (PasswordTableModel.LENGTH_COLUMN, 'length')):
+            def sort():
+                orders.reverse()
+                window.table_view.sortByColumn(column, orders[0])
+            report(f'table: sort by {name}', size, measure(sort, repeat=20))
+        window.table_view.sortByColumn(-1, Qt.AscendingOrder)
+
+    window.smart_pass_man.smart_passwords = {}
+    window.close()
+
+
+def bench_export_import(sizes, work_dir, repeat=5):
+    from unittest import mock
+    from PyQt5.QtCore import QEventLoop
+    from PyQt5.QtWidgets import QDialog
+    from core.dialogs.export_import_dialog import ExportImportDialog
+    from core.utils.sound_manager import SoundManager
+
+    sound_manager = SoundManager()
+
+    def export(manager, filename):
+        dialog = ExportImportDialog(mode="export", smart_pass_man=manager, sound_manager=sound_manager)
+        dialog.selected_file = filename
+        loop = QEventLoop()
+        dialog.finished.connect(loop.quit)
+        dialog.export_passwords()
+        loop.exec_()
+
+    def import_(filename):
+        manager = SmartPasswordManager(os.path.join(work_dir, 'import_target.json'))
+        manager.smart_passwords = {}
+        dialog = ExportImportDialog(mode="import", smart_pass_man=manager, sound_manager=sound_manager)
+        dialog.selected_file = filename
+        dialog.import_passwords()
+
+    # The dialogs confirm with a modal preview and message box; keep them from
+    # blocking the run.
+    with mock.patch('core.dialogs.export_import_dialog.QMessageBox'), \
+            mock.patch('core.dialogs.import_preview_dialog.ImportPreviewDialog.exec_', return_value=QDialog.Accepted):
+        for size in sizes:
+            manager = make_manager(size, os.path.join(work_dir, f'export_source_{size}.json'))
+            filename = os.path.join(work_dir, f'export_{size}.json')
+            report('export: ExportImportDialog', size, measure(lambda: export(manager, filename), repeat=repeat))
+            report('import: ExportImportDialog', size, measure(lambda: import_(filename), repeat=repeat))
+
+
+BENCHMARKS = {
+    'edit': bench_edit_lookup,
+    'batch': bench_batch_writes,
+    'startup': bench_startup,
+    'cli': bench_cli_throughput,
+    'retrieval': bench_retrieval,
+    'derivation': bench_derivation,
+    'table': bench_table_population,
+    'transfer': bench_export_import,
+    'persist': bench_write_behind,
+    'store': bench_store_open,
+    'memory': bench_memory,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Smart Password Manager benchmarks')
+    parser.add_argument('names', nargs='*', metavar='name',
+                        help=f'Benchmarks to run: {", ".join(BENCHMARKS)} (default: all)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Number of metadata entries to benchmark with')
+    parser.add_argument('--save-baseline', metavar='FILE',
+                        help='Write the results to FILE as a baseline for later comparison')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='Compare the results with a saved baseline; exit with 1 on regressions')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, metavar='PERCENT',
+                        help=f'Slowdown counted as a regression by --compare (default: {DEFAULT_THRESHOLD:g}%%)')
+    args = parser.parse_args()
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f'unknown benchmark: {", ".join(unknown)}')
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        for name in args.names or BENCHMARKS:
+            BENCHMARKS[name](args.sizes, work_dir)
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline)
+    if args.compare and not compare_baseline(args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
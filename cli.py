@@ -0,0 +1,106 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from core.utils.binary_store import open_password_manager
+from core.utils.password_engine import derive_keys, expand_password
+
+_lengths = {}
+
+
+def _init_worker(lengths):
+    global _lengths
+    _lengths = lengths
+
+
+def regenerate(secret):
+    public_key, private_key = derive_keys(secret)
+    length = _lengths.get(public_key)
+    if length is None:
+        return public_key, None
+    return public_key, expand_password(private_key, length)
+
+
+def read_secrets(stream):
+    for line in stream:
+        secret = line.rstrip('\r\n')
+        if secret:
+            yield secret
+
+
+def select_entries(smart_pass_man, public_keys, descriptions):
+    passwords = smart_pass_man.passwords
+    if not public_keys and not descriptions:
+        return dict(passwords)
+
+    selected = {public_key: passwords[public_key] for public_key in public_keys if public_key in passwords}
+    if descriptions:
+        wanted = {description.casefold() for description in descriptions}
+        for public_key, smart_password in passwords.items():
+            if smart_password.description.casefold() in wanted:
+                selected[public_key] = smart_password
+    return selected
+
+
+def positive_int(value):
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'invalid int value: {value!r}')
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1, got {number}')
+    return number
+
+
+def run(secrets, entries, jobs=None, chunksize=64):
+    lengths = {public_key: sp.length for public_key, sp in entries.items()}
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(lengths,)) as executor:
+        for index, (public_key, password) in enumerate(executor.map(regenerate, secrets, chunksize=chunksize)):
+            if password is None:
+                yield {"index": index, "status": "no_match"}
+            else:
+                smart_password = entries[public_key]
+                yield {
+                    "index": index,
+                    "status": "ok",
+                    "public_key": public_key,
+                    "description": smart_password.description,
+                    "length": smart_password.length,
+                    "password": password,
+                }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='cli.py',
+        description='Regenerate smart passwords without the GUI. Secret phrases are read from stdin, '
+                    'one per line; one JSON object is written to stdout per secret.'
+    )
+    parser.add_argument('--file', help='Metadata file, JSON or .bin store (default: the one the GUI uses)')
+    parser.add_argument('--public-key', action='append', default=[], metavar='KEY',
+                        help='Only regenerate this entry (repeatable)')
+    parser.add_argument('--description', action='append', default=[], metavar='TEXT',
+                        help='Only regenerate entries with this description, case-insensitive (repeatable)')
+    parser.add_argument('--jobs', type=positive_int, default=os.cpu_count(),
+                        help='Worker processes (default: number of CPUs)')
+    args = parser.parse_args(argv)
+
+    smart_pass_man = open_password_manager(args.file)
+    entries = select_entries(smart_pass_man, args.public_key, args.description)
+    if not entries:
+        print('No matching password entries.', file=sys.stderr)
+        return 1
+
+    matched = 0
+    for result in run(read_secrets(sys.stdin), entries, jobs=args.jobs):
+        matched += result["status"] == "ok"
+        print(json.dumps(result))
+    sys.stdout.flush()
+    return 0 if matched else 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from PyQt5.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QToolTip
+from PyQt5.QtGui import QColor, QPainter
+from PyQt5.QtCore import Qt, QEvent, QModelIndex, QPersistentModelIndex, QSize, pyqtSignal
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    # Paints a button in every cell of its column instead of creating widgets.
+    # Colors and font are resolved once here, so painting a row costs a few
+    # draw calls rather than a stylesheet parse per button.
+
+    clicked = pyqtSignal(QModelIndex)
+
+    def __init__(self, parent=None, background_color="#2a82da", width=80):
+        super().__init__(parent)
+        self.background_color = background_color
+        self.width = width
+        self._colors = {
+            'normal': QColor(background_color),
+            'hover': QColor(background_color).darker(115),
+            'pressed': QColor(background_color).darker(140),
+        }
+        self._text_color = QColor("white")
+        self._font = None
+        self._pressed = QPersistentModelIndex()
+
+    def button_rect(self, option):
+        return option.rect.adjusted(4, 4, -4, -4)
+
+    def hit_test(self, option, pos):
+        return self.button_rect(option).contains(pos)
+
+    def _button_color(self, option, index):
+        if self._pressed.isValid() and self._pressed == QPersistentModelIndex(index):
+            return self._colors['pressed']
+        if option.state & QStyle.State_MouseOver:
+            return self._colors['hover']
+        return self._colors['normal']
+
+    def paint(self, painter, option, index):
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+
+        if self._font is None:
+            self._font = QApplication.font(option.widget)
+            self._font.setBold(True)
+
+        rect = self.button_rect(option)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._button_color(option, index))
+        painter.drawRoundedRect(rect, 3, 3)
+        painter.setPen(self._text_color)
+        painter.setFont(self._font)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, index.data())
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(self.width, 30)
+
+    def _set_pressed(self, index, view):
+        previous = self._pressed
+        self._pressed = QPersistentModelIndex(index)
+        if view is not None:
+            if previous.isValid():
+                view.update(QModelIndex(previous))
+            if index.isValid():
+                view.update(index)
+
+    def editorEvent(self, event, model, option, index):
+        event_type = event.type()
+        if event_type not in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease, QEvent.MouseButtonDblClick):
+            return False
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+
+        inside = self.hit_test(option, event.pos())
+        if event_type == QEvent.MouseButtonPress:
+            self._set_pressed(index if inside else QModelIndex(), option.widget)
+            return False
+
+        if event_type == QEvent.MouseButtonDblClick:
+            return inside
+
+        was_pressed = self._pressed.isValid() and self._pressed == QPersistentModelIndex(index)
+        self._set_pressed(QModelIndex(), option.widget)
+        if inside and was_pressed:
+            self.clicked.emit(index)
+            return True
+        return False
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() != QEvent.ToolTip:
+            return super().helpEvent(event, view, option, index)
+
+        tooltip = index.data(Qt.ToolTipRole)
+        if tooltip and self.hit_test(option, event.pos()):
+            QToolTip.showText(event.globalPos(), tooltip, view, self.button_rect(option))
+        else:
+            QToolTip.hideText()
+            event.ignore()
+        return True
@@ -0,0 +1,193 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from PyQt5.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+from PyQt5.QtCore import Qt, QThreadPool
+from PyQt5.QtGui import QColor
+
+from core.models.styles.batch_get_dialog_styles import BatchGetDialogStyles
+from core.utils.derivation_worker import DerivationWorker
+
+
+class BatchGetDialog(QDialog):
+
+    DESCRIPTION_COLUMN = 0
+    LENGTH_COLUMN = 1
+    PASSWORD_COLUMN = 2
+
+    def __init__(self, parent=None, smart_passwords=(), derive=None, sound_manager=None):
+        super().__init__(parent)
+        self.setWindowTitle(f'Get {len(smart_passwords)} Passwords')
+        self.setMinimumSize(600, 400)
+
+        self.styles = BatchGetDialogStyles()
+        self.sound_manager = sound_manager
+        self.derive = derive
+        self.lengths = {smart_password.public_key: smart_password.length for smart_password in smart_passwords}
+        self.rows = {}
+        self.workers = set()
+        # Workers cancelled by closing the dialog stay referenced until they
+        # report, since a result may already be queued for them.
+        self._retired = set()
+        self.matched = 0
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setSpacing(10)
+
+        instruction = QLabel(
+            'Enter secret phrases one at a time. Each secret is checked against every selected '
+            'entry in the background, and matching passwords appear below as soon as they are ready.'
+        )
+        instruction.setWordWrap(True)
+        self.layout.addWidget(instruction)
+
+        self.results_table = QTableWidget(len(smart_passwords), 3, self)
+        self.results_table.setHorizontalHeaderLabels(['Description', 'Length', 'Password'])
+        self.results_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.results_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.results_table.setStyleSheet(self.styles.results_table_style)
+        self.results_table.verticalHeader().hide()
+        header = self.results_table.horizontalHeader()
+        header.setSectionResizeMode(self.DESCRIPTION_COLUMN, QHeaderView.Stretch)
+        header.setSectionResizeMode(self.LENGTH_COLUMN, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(self.PASSWORD_COLUMN, QHeaderView.Stretch)
+
+        for row, smart_password in enumerate(smart_passwords):
+            self.rows[smart_password.public_key] = row
+            self.results_table.setItem(row, self.DESCRIPTION_COLUMN, QTableWidgetItem(smart_password.description))
+            length_item = QTableWidgetItem(str(smart_password.length))
+            length_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.results_table.setItem(row, self.LENGTH_COLUMN, length_item)
+            pending_item = QTableWidgetItem('Waiting for secret...')
+            pending_item.setForeground(QColor(self.styles.pending_color))
+            self.results_table.setItem(row, self.PASSWORD_COLUMN, pending_item)
+        self.layout.addWidget(self.results_table)
+
+        secret_layout = QHBoxLayout()
+        self.secret_input = QLineEdit(self)
+        self.secret_input.setPlaceholderText('Enter a secret phrase and press Enter')
+        self.secret_input.setEchoMode(QLineEdit.Password)
+        self.secret_input.returnPressed.connect(self.submit_secret)
+        secret_layout.addWidget(self.secret_input)
+
+        self.show_secret_checkbox = QPushButton("👁 Show")
+        self.show_secret_checkbox.setCheckable(True)
+        self.show_secret_checkbox.setMaximumWidth(100)
+        self.show_secret_checkbox.clicked.connect(self.sound_manager.play_click)
+        self.show_secret_checkbox.clicked.connect(self.toggle_secret_visibility)
+        secret_layout.addWidget(self.show_secret_checkbox)
+
+        self.submit_button = QPushButton('Check Secret', self)
+        self.submit_button.setAutoDefault(False)
+        self.submit_button.clicked.connect(self.sound_manager.play_click)
+        self.submit_button.clicked.connect(self.submit_secret)
+        self.submit_button.setStyleSheet(self.styles.submit_button_style)
+        secret_layout.addWidget(self.submit_button)
+        self.layout.addLayout(secret_layout)
+
+        self.status_label = QLabel()
+        self.status_label.setStyleSheet(self.styles.status_style)
+        self.layout.addWidget(self.status_label)
+        self.update_status()
+
+        button_layout = QHBoxLayout()
+        self.copy_button = QPushButton("📋 Copy Selected")
+        self.copy_button.setAutoDefault(False)
+        self.copy_button.clicked.connect(self.sound_manager.play_click)
+        self.copy_button.clicked.connect(self.copy_selected)
+        button_layout.addWidget(self.copy_button)
+        button_layout.addStretch()
+
+        self.close_button = QPushButton('Close', self)
+        self.close_button.setAutoDefault(False)
+        self.close_button.clicked.connect(self.sound_manager.play_click)
+        self.close_button.clicked.connect(self.accept)
+        button_layout.addWidget(self.close_button)
+        self.layout.addLayout(button_layout)
+
+    def toggle_secret_visibility(self):
+        if self.show_secret_checkbox.isChecked():
+            self.secret_input.setEchoMode(QLineEdit.Normal)
+            self.show_secret_checkbox.setText("🙈 Hide")
+        else:
+            self.secret_input.setEchoMode(QLineEdit.Password)
+            self.show_secret_checkbox.setText("👁 Show")
+
+    def submit_secret(self):
+        secret = self.secret_input.text()
+        self.secret_input.clear()
+        if not secret:
+            return
+
+        worker = DerivationWorker(self.derive, secret, self.lengths)
+        worker.signals.finished.connect(lambda result: self._on_derived(worker, *result))
+        worker.signals.failed.connect(lambda error: self._on_failed(worker, error))
+        self.workers.add(worker)
+        self.update_status()
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_derived(self, worker, public_key, password):
+        if worker not in self.workers:
+            self._retired.discard(worker)
+            return
+        self.workers.discard(worker)
+
+        if password is None:
+            self.update_status('Secret did not match any selected entry')
+            self.sound_manager.play_error()
+            return
+
+        item = self.results_table.item(self.rows[public_key], self.PASSWORD_COLUMN)
+        if item.data(Qt.ItemDataRole.UserRole) is None:
+            self.matched += 1
+        item.setText(password)
+        item.setData(Qt.ItemDataRole.UserRole, password)
+        item.setForeground(QColor(self.styles.matched_color))
+        self.results_table.scrollToItem(item)
+        self.update_status()
+        self.sound_manager.play_notify()
+
+    def _on_failed(self, worker, error):
+        if worker not in self.workers:
+            self._retired.discard(worker)
+            return
+        self.workers.discard(worker)
+        self.update_status(f'Failed to generate password: {error}')
+
+    def update_status(self, message=None):
+        status = f'{self.matched} of {len(self.rows)} passwords retrieved'
+        if self.workers:
+            status += f', checking {len(self.workers)} secret(s)...'
+        if message:
+            status += f' — {message}'
+        self.status_label.setText(status)
+
+    def copy_selected(self):
+        passwords = []
+        for index in self.results_table.selectionModel().selectedRows(self.PASSWORD_COLUMN):
+            password = index.data(Qt.ItemDataRole.UserRole)
+            if password is not None:
+                passwords.append(password)
+        if not passwords:
+            return
+
+        QApplication.clipboard().setText('\n'.join(passwords))
+        self.copy_button.setText("✅ Copied!")
+        self.copy_button.setStyleSheet(self.styles.copy_button_style)
+
+    def done(self, result):
+        for worker in self.workers:
+            worker.cancel()
+        self._retired.update(self.workers)
+        self.workers.clear()
+        super().done(result)
@@ -219,6 +219,7 @@ Icon={self.icon_path if self.icon_path else 'system-run'}
 Terminal=false
 Categories=Utility;Security;
 StartupNotify=true
+SingleMainWindow=true
 Keywords=password;manager;security;encryption;
 """
         return content
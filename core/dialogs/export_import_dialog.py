@@ -1,5 +1,7 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
 import json
+import os
+from itertools import islice
 from pathlib import Path
 from PyQt5.QtWidgets import (
     QDialog,
@@ -12,14 +14,27 @@ from PyQt5.QtWidgets import (
     QCheckBox,
     QGroupBox,
     QRadioButton,
-    QButtonGroup
+    QButtonGroup,
+    QProgressDialog
 )
+from PyQt5.QtCore import Qt, QThreadPool, pyqtSignal
 
 from core.models.configs.export_import_dialog_config import ExportImportDialogConfig
 from core.models.styles.export_import_dialog_styles import ExportImportDialogStyles
+from core.utils.binary_store import snapshot_passwords
+from core.utils.export_worker import ExportWorker
+from core.utils.import_planner import ImportPlanner
+from core.utils.json_stream import iter_object_items
+from core.utils.metadata_batch import MetadataBatch
 
 
 class ExportImportDialog(QDialog):
+
+    passwords_imported = pyqtSignal(list)
+    passwords_updated = pyqtSignal(list)
+
+    import_chunk_size = 1000
+
     def __init__(self, parent=None, mode="export", smart_pass_man=None, sound_manager=None):
         super().__init__(parent)
         self.mode = mode
@@ -28,6 +43,7 @@ class ExportImportDialog(QDialog):
         self.config = ExportImportDialogConfig()
         self.sound_manager = sound_manager
         self.selected_file = None
+        self.export_worker = None
 
         title = "Export Passwords" if mode == "export" else "Import Passwords"
         self.setWindowTitle(title)
@@ -65,7 +81,8 @@ class ExportImportDialog(QDialog):
         if mode == "import":
             warning = QLabel(
                 "⚠️ <b>Warning:</b> Importing will merge with existing passwords. "
-                "If public keys conflict, existing entries will be preserved."
+                "If public keys conflict, existing entries are preserved unless you choose to "
+                "overwrite them in the preview."
             )
             warning.setWordWrap(True)
             warning.setStyleSheet(self.styles.warning_style)
@@ -163,96 +180,182 @@ class ExportImportDialog(QDialog):
             self.import_passwords()
 
     def export_passwords(self):
-        try:
-            export_data = {}
-
-            if self.include_metadata.isChecked():
-                from datetime import datetime
-
-                export_data["_metadata"] = {
-                    "exported_at": datetime.now().isoformat(),
-                    "app_name": self.config.app_long_name,
-                    "app_version": self.config.version,
-                    "app_type": self.config.app_type,
-                    "lib_name": self.config.lib_name,
-                    "lib_version": self.config.lib_version,
-                    "lib_lang": self.config.lib_lang,
-                    "count": self.smart_pass_man.password_count
-                }
-
-            for public_key, sp in self.smart_pass_man.passwords.items():
-                export_data[public_key] = sp.to_dict()
+        metadata = None
+        if self.include_metadata.isChecked():
+            from datetime import datetime
 
-            indent = 2 if self.format_json.isChecked() else None
-            separators = (',', ':') if self.format_minified.isChecked() else None
+            metadata = {
+                "exported_at": datetime.now().isoformat(),
+                "app_name": self.config.app_long_name,
+                "app_version": self.config.version,
+                "app_type": self.config.app_type,
+                "lib_name": self.config.lib_name,
+                "lib_version": self.config.lib_version,
+                "lib_lang": self.config.lib_lang,
+                "count": self.smart_pass_man.password_count
+            }
+
+        indent = 2 if self.format_json.isChecked() else None
+        separators = (',', ':') if self.format_minified.isChecked() else None
+
+        self.export_worker = ExportWorker(
+            self.selected_file,
+            snapshot_passwords(self.smart_pass_man.passwords),
+            metadata=metadata,
+            indent=indent,
+            separators=separators
+        )
+
+        total = max(self.smart_pass_man.password_count, 1)
+        self.export_progress = QProgressDialog("Exporting passwords...", "Cancel", 0, total, self)
+        self.export_progress.setWindowTitle("Export Passwords")
+        self.export_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self.export_progress.setMinimumDuration(500)
+        self.export_progress.setAutoReset(False)
+        self.export_progress.canceled.connect(self.export_worker.cancel)
+
+        self.export_worker.signals.progress.connect(lambda written, _: self.export_progress.setValue(written))
+        self.export_worker.signals.finished.connect(self._on_export_finished)
+        self.export_worker.signals.failed.connect(self._on_export_failed)
+        self.export_worker.signals.cancelled.connect(self._on_export_cancelled)
 
-            with open(self.selected_file, 'w') as f:
-                json.dump(export_data, f, indent=indent, separators=separators)
+        self.action_button.setEnabled(False)
+        QThreadPool.globalInstance().start(self.export_worker)
+
+    def _finish_export(self):
+        self.export_progress.reset()
+        self.export_progress.deleteLater()
+        self.action_button.setEnabled(True)
+
+    def _on_export_finished(self, count):
+        self._finish_export()
+        self.sound_manager.play_notify()
+        QMessageBox.information(
+            self,
+            "Export Successful",
+            f"Successfully exported {count} passwords to:\n{self.selected_file}"
+        )
+        self.accept()
+
+    def _on_export_failed(self, error):
+        self._finish_export()
+        self.sound_manager.play_error()
+        QMessageBox.critical(
+            self,
+            "Export Failed",
+            f"Failed to export passwords:\n{error}"
+        )
+
+    def _on_export_cancelled(self):
+        self._finish_export()
+
+    def reject(self):
+        if self.export_worker is not None:
+            self.export_worker.cancel()
+        super().reject()
 
-            self.sound_manager.play_notify()
-            QMessageBox.information(
+    def import_passwords(self):
+        try:
+            plan = self._plan_import()
+        except json.JSONDecodeError:
+            self.sound_manager.play_error()
+            QMessageBox.critical(
                 self,
-                "Export Successful",
-                f"Successfully exported {self.smart_pass_man.password_count} passwords to:\n{self.selected_file}"
+                "Import Failed",
+                "Invalid JSON file format."
             )
-            self.accept()
-
+            return
         except Exception as e:
             self.sound_manager.play_error()
             QMessageBox.critical(
                 self,
-                "Export Failed",
-                f"Failed to export passwords:\n{str(e)}"
+                "Import Failed",
+                f"Failed to import passwords:\n{str(e)}"
             )
+            return
 
-    def import_passwords(self):
-        try:
-            with open(self.selected_file, 'r') as f:
-                import_data = json.load(f)
-
-            if "_metadata" in import_data:
-                _ = import_data.pop("_metadata")
-
-            added = 0
-            skipped = 0
-
-            for public_key, data in import_data.items():
-                if not isinstance(data, dict) or 'public_key' not in data:
-                    skipped += 1
-                    continue
+        if plan is None:
+            return
 
-                if public_key in self.smart_pass_man.passwords:
-                    skipped += 1
-                    continue
+        from core.dialogs.import_preview_dialog import ImportPreviewDialog
 
-                from smartpasslib import SmartPassword
-                try:
-                    sp = SmartPassword.from_dict(data)
-                    self.smart_pass_man.add_smart_password(sp)
-                    added += 1
-                except:
-                    skipped += 1
+        preview = ImportPreviewDialog(self, plan, self.sound_manager)
+        if preview.exec_() != QDialog.Accepted:
+            return
 
-            self.sound_manager.play_notify()
+        self._commit_import(plan, preview.overwrite_conflicts())
 
-            msg = f"Import completed:\n• Added: {added} new passwords\n• Skipped: {skipped} entries"
-            if added > 0:
-                msg += "\n\nRefresh the main window to see new passwords."
+    def _plan_import(self):
+        progress = QProgressDialog("Reading import file...", "Cancel", 0, 1000, self)
+        progress.setWindowTitle("Import Passwords")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
 
-            QMessageBox.information(self, "Import Successful", msg)
-            self.accept()
+        file_size = max(os.path.getsize(self.selected_file), 1)
+        planner = ImportPlanner(self.smart_pass_man.passwords)
 
-        except json.JSONDecodeError:
-            self.sound_manager.play_error()
-            QMessageBox.critical(
-                self,
-                "Import Failed",
-                "Invalid JSON file format."
-            )
+        try:
+            with open(self.selected_file, 'rb') as f:
+                items = iter_object_items(f)
+                while True:
+                    chunk = list(islice(items, self.import_chunk_size))
+                    if not chunk:
+                        break
+
+                    planner.add_chunk(chunk)
+
+                    progress.setValue(f.tell() * 1000 // file_size)
+                    if progress.wasCanceled():
+                        return None
+        finally:
+            progress.reset()
+
+        return planner.finish()
+
+    def _commit_import(self, plan, overwrite_conflicts):
+        added_public_keys = []
+        updated = []
+        try:
+            with MetadataBatch(self.smart_pass_man) as batch:
+                added_public_keys.extend(batch.add_smart_passwords(plan.new))
+                if overwrite_conflicts:
+                    updated = batch.update_smart_passwords(
+                        (conflict.public_key, conflict.description, conflict.length)
+                        for conflict in plan.conflicts
+                    )
         except Exception as e:
+            self._rollback_import(added_public_keys)
+            self._rollback_updates(plan.conflicts if overwrite_conflicts else ())
             self.sound_manager.play_error()
             QMessageBox.critical(
                 self,
                 "Import Failed",
                 f"Failed to import passwords:\n{str(e)}"
             )
+            return
+
+        if added_public_keys:
+            self.passwords_imported.emit(added_public_keys)
+        if updated:
+            self.passwords_updated.emit(updated)
+
+        self.sound_manager.play_notify()
+
+        skipped = plan.skipped + (0 if overwrite_conflicts else len(plan.conflicts))
+        msg = (f"Import completed:\n• Added: {len(added_public_keys)} new passwords\n"
+               f"• Updated: {len(updated)} conflicting entries\n"
+               f"• Skipped: {skipped} entries")
+
+        QMessageBox.information(self, "Import Successful", msg)
+        self.accept()
+
+    def _rollback_import(self, added_public_keys):
+        for public_key in added_public_keys:
+            self.smart_pass_man.passwords.pop(public_key, None)
+        added_public_keys.clear()
+
+    def _rollback_updates(self, conflicts):
+        for conflict in conflicts:
+            smart_password = self.smart_pass_man.passwords.get(conflict.public_key)
+            if smart_password is not None:
+                smart_password.update(description=conflict.current_description, length=conflict.current_length)
@@ -0,0 +1,131 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from PyQt5.QtWidgets import (
+    QAbstractItemView,
+    QCheckBox,
+    QDialog,
+    QGroupBox,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPlainTextEdit,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor
+
+from core.models.styles.import_preview_dialog_styles import ImportPreviewDialogStyles
+
+
+class ImportPreviewDialog(QDialog):
+
+    max_listed = 500
+
+    def __init__(self, parent=None, plan=None, sound_manager=None):
+        super().__init__(parent)
+        self.setWindowTitle('Import Preview')
+        self.setMinimumSize(650, 450)
+
+        self.plan = plan
+        self.styles = ImportPreviewDialogStyles()
+        self.sound_manager = sound_manager
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setSpacing(10)
+
+        summary = QLabel(
+            f'<b>{len(plan.new)}</b> new entries will be added.<br>'
+            f'<b>{len(plan.duplicates)}</b> entries already exist unchanged.<br>'
+            f'<b>{len(plan.conflicts)}</b> entries exist with a different description or length.<br>'
+            f'<b>{len(plan.invalid)}</b> invalid entries and <b>{plan.repeated}</b> repeated keys will be skipped.'
+        )
+        summary.setTextFormat(Qt.TextFormat.RichText)
+        summary.setWordWrap(True)
+        self.layout.addWidget(summary)
+
+        self.overwrite_checkbox = None
+        if plan.conflicts:
+            self._setup_conflicts()
+
+        if plan.invalid:
+            self._setup_invalid()
+
+        button_layout = QHBoxLayout()
+        self.cancel_button = QPushButton('Cancel', self)
+        self.cancel_button.clicked.connect(self.sound_manager.play_click)
+        self.cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(self.cancel_button)
+
+        self.import_button = QPushButton('Import', self)
+        self.import_button.setDefault(True)
+        self.import_button.clicked.connect(self.sound_manager.play_click)
+        self.import_button.clicked.connect(self.accept)
+        self.import_button.setStyleSheet(self.styles.import_button_style)
+        self.import_button.setEnabled(bool(plan.new or plan.conflicts))
+        button_layout.addWidget(self.import_button)
+        self.layout.addLayout(button_layout)
+
+    def _setup_conflicts(self):
+        conflicts = self.plan.conflicts
+        group = QGroupBox(f'Conflicts ({len(conflicts)})')
+        group_layout = QVBoxLayout()
+
+        listed = conflicts[:self.max_listed]
+        table = QTableWidget(len(listed), 4, self)
+        table.setHorizontalHeaderLabels(['Current description', 'Imported description', 'Current', 'Imported'])
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.verticalHeader().hide()
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
+
+        changed = QColor(self.styles.changed_color)
+        for row, conflict in enumerate(listed):
+            values = (
+                conflict.current_description,
+                conflict.description,
+                str(conflict.current_length),
+                str(conflict.length),
+            )
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                item.setToolTip(conflict.public_key)
+                table.setItem(row, column, item)
+            if conflict.description != conflict.current_description:
+                table.item(row, 1).setForeground(changed)
+            if conflict.length != conflict.current_length:
+                table.item(row, 3).setForeground(changed)
+        group_layout.addWidget(table)
+
+        if len(conflicts) > len(listed):
+            more = QLabel(f'... and {len(conflicts) - len(listed)} more')
+            more.setStyleSheet(self.styles.note_style)
+            group_layout.addWidget(more)
+
+        self.overwrite_checkbox = QCheckBox('Overwrite conflicting entries with the imported description and length')
+        group_layout.addWidget(self.overwrite_checkbox)
+
+        group.setLayout(group_layout)
+        self.layout.addWidget(group)
+
+    def _setup_invalid(self):
+        invalid = self.plan.invalid
+        group = QGroupBox(f'Invalid entries ({len(invalid)})')
+        group_layout = QVBoxLayout()
+
+        details = QPlainTextEdit(self)
+        details.setReadOnly(True)
+        details.setMaximumHeight(100)
+        details.setPlainText('\n'.join(f'{key}: {error}' for key, error in invalid[:self.max_listed]))
+        details.setStyleSheet(self.styles.invalid_style)
+        group_layout.addWidget(details)
+
+        group.setLayout(group_layout)
+        self.layout.addWidget(group)
+
+    def overwrite_conflicts(self):
+        return self.overwrite_checkbox is not None and self.overwrite_checkbox.isChecked()
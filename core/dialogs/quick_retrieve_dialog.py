@@ -0,0 +1,184 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from PyQt5.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QDesktopWidget,
+    QDialog,
+    QLabel,
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
+    QVBoxLayout,
+)
+from PyQt5.QtCore import Qt, QEvent, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QCursor
+
+from core.models.styles.quick_retrieve_dialog_styles import QuickRetrieveDialogStyles
+from core.utils.derivation_worker import DerivationWorker
+
+
+class QuickRetrieveDialog(QDialog):
+    # Type-ahead entry selection plus a secret field: Enter in the search
+    # field moves to the secret, Enter there copies the password and closes.
+    # Matches come from the window's description index, so nothing is loaded
+    # or indexed when the popup opens.
+
+    max_matches = 8
+
+    password_copied = pyqtSignal(str)
+
+    def __init__(self, parent=None, smart_pass_man=None, description_index=None, derive=None, sound_manager=None):
+        super().__init__(parent)
+        self.setWindowTitle('Quick Retrieve')
+        self.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.WindowStaysOnTopHint)
+        self.setMinimumWidth(420)
+
+        self.styles = QuickRetrieveDialogStyles()
+        self.smart_pass_man = smart_pass_man
+        self.description_index = description_index
+        self.derive = derive
+        self.sound_manager = sound_manager
+        self.worker = None
+        # A worker cancelled by closing the dialog stays referenced until it
+        # reports, since its result may already be queued.
+        self._retired = set()
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setSpacing(8)
+
+        self.search_input = QLineEdit(self)
+        self.search_input.setPlaceholderText('Type to find an entry...')
+        self.search_input.setStyleSheet(self.styles.search_input_style)
+        self.search_input.textChanged.connect(self.update_matches)
+        self.search_input.returnPressed.connect(self.focus_secret)
+        self.search_input.installEventFilter(self)
+        self.layout.addWidget(self.search_input)
+
+        self.matches_list = QListWidget(self)
+        self.matches_list.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.matches_list.setStyleSheet(self.styles.matches_list_style)
+        self.matches_list.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.matches_list.itemClicked.connect(lambda item: self.focus_secret())
+        self.matches_list.currentItemChanged.connect(lambda current, previous: self.update_status())
+        self.layout.addWidget(self.matches_list)
+
+        self.secret_input = QLineEdit(self)
+        self.secret_input.setPlaceholderText('Secret phrase, then Enter to copy the password')
+        self.secret_input.setEchoMode(QLineEdit.Password)
+        self.secret_input.returnPressed.connect(self.submit_secret)
+        self.layout.addWidget(self.secret_input)
+
+        self.status_label = QLabel(self)
+        self.status_label.setStyleSheet(self.styles.status_style)
+        self.layout.addWidget(self.status_label)
+
+        self.update_matches('')
+
+    def show_centered(self):
+        screen = QDesktopWidget().availableGeometry(QCursor.pos())
+        self.adjustSize()
+        frame = self.frameGeometry()
+        frame.moveCenter(screen.center())
+        self.move(frame.topLeft())
+        self.show()
+        self.raise_()
+        self.activateWindow()
+        self.search_input.setFocus()
+
+    def eventFilter(self, watched, event):
+        if watched is self.search_input and event.type() == QEvent.KeyPress:
+            if event.key() in (Qt.Key.Key_Down, Qt.Key.Key_Up):
+                step = 1 if event.key() == Qt.Key.Key_Down else -1
+                row = min(max(self.matches_list.currentRow() + step, 0), self.matches_list.count() - 1)
+                self.matches_list.setCurrentRow(row)
+                return True
+        return super().eventFilter(watched, event)
+
+    def update_matches(self, text):
+        self.matches_list.clear()
+        passwords = self.smart_pass_man.passwords
+        for public_key in self.description_index.best_matches(text, self.max_matches):
+            smart_password = passwords.get(public_key)
+            if smart_password is None:
+                continue
+            item = QListWidgetItem(f'{smart_password.description}  ({smart_password.length} chars)')
+            item.setData(Qt.ItemDataRole.UserRole, public_key)
+            self.matches_list.addItem(item)
+
+        if self.matches_list.count():
+            self.matches_list.setCurrentRow(0)
+        self.matches_list.setFixedHeight(
+            self.matches_list.sizeHintForRow(0) * self.max_matches + 2 * self.matches_list.frameWidth()
+            if self.matches_list.count() else 0
+        )
+        self.update_status()
+
+    def selected_password(self):
+        item = self.matches_list.currentItem()
+        if item is None:
+            return None
+        return self.smart_pass_man.passwords.get(item.data(Qt.ItemDataRole.UserRole))
+
+    def update_status(self, message=None, style=None):
+        if message is None:
+            if not self.search_input.text().strip():
+                message = 'Start typing a description'
+            elif self.selected_password() is None:
+                message = 'No matching entries'
+            else:
+                message = f'Get password for "{self.selected_password().description}"'
+        self.status_label.setText(message)
+        self.status_label.setStyleSheet(style or self.styles.status_style)
+
+    def focus_secret(self):
+        if self.selected_password() is not None:
+            self.secret_input.setFocus()
+
+    def submit_secret(self):
+        smart_password = self.selected_password()
+        secret = self.secret_input.text()
+        if smart_password is None:
+            self.search_input.setFocus()
+            return
+        if not secret or self.worker is not None:
+            return
+
+        worker = DerivationWorker(self.derive, secret, smart_password.public_key, smart_password.length)
+        worker.signals.finished.connect(lambda result: self._on_derived(worker, smart_password.description, *result))
+        worker.signals.failed.connect(lambda error: self._on_failed(worker, error))
+        self.worker = worker
+        self.update_status('Checking secret phrase...')
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_derived(self, worker, description, is_valid, password):
+        if worker is not self.worker:
+            self._retired.discard(worker)
+            return
+        self.worker = None
+
+        if not is_valid:
+            self.sound_manager.play_error()
+            self.update_status(f'The secret phrase does not match "{description}"', self.styles.error_style)
+            self.secret_input.selectAll()
+            self.secret_input.setFocus()
+            return
+
+        QApplication.clipboard().setText(password)
+        self.sound_manager.play_notify()
+        self.password_copied.emit(description)
+        self.accept()
+
+    def _on_failed(self, worker, error):
+        if worker is not self.worker:
+            self._retired.discard(worker)
+            return
+        self.worker = None
+        self.update_status(f'Failed to generate password: {error}', self.styles.error_style)
+
+    def done(self, result):
+        if self.worker is not None:
+            self.worker.cancel()
+            self._retired.add(self.worker)
+            self.worker = None
+        self.secret_input.clear()
+        super().done(result)
@@ -1,6 +1,7 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
 import os
 import sys
+import warnings
 
 from PyQt5.QtWidgets import (
     QDesktopWidget,
@@ -10,25 +11,31 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
     QMessageBox,
     QDialog,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QAbstractItemView,
     QFrame,
     QHeaderView,
     QHBoxLayout,
-    QAction, QMenuBar, QStatusBar, QMainWindow, QMenu, QScrollArea
+    QAction, QMenuBar, QStatusBar, QMainWindow, QMenu, QScrollArea, QProgressDialog, QLineEdit,
+    QActionGroup, QFileDialog, QInputDialog, QApplication, QStyle, QSystemTrayIcon
 )
 from PyQt5.QtGui import QFont, QIcon
-from PyQt5.QtCore import Qt
-from PyQt5.QtMultimedia import QSound
-from smartpasslib import SmartPasswordManager, SmartPassword, SmartPasswordMaster
-
-from core.dialogs.edit_password_dialog import EditPasswordDialog
-from core.dialogs.password_display_dialog import PasswordDisplayDialog
-from core.dialogs.password_input_dialog import PasswordInputDialog
-from core.dialogs.secret_input_dialog import SecretInputDialog
+from PyQt5.QtCore import Qt, QThreadPool, QTimer
+from smartpasslib import SmartPassword
+
+from core.delegates.action_button_delegate import ActionButtonDelegate
 from core.models.configs.main_window_config import MainWindowConfig
+from core.models.password_filter_proxy_model import PasswordFilterProxyModel
+from core.models.password_table_model import PasswordTableModel
 from core.models.styles.main_window_styles import MainWindowStyles
+from core.utils.binary_store import STORE_SUFFIX, convert_to_binary_store, convert_to_json, is_store_path
+from core.utils.derivation_worker import DerivationWorker
+from core.utils.password_engine import derive_keys, expand_password, verify_secret
+from core.utils.secret_cache import SecretCache
 from core.utils.sound_manager import SoundManager
+from core.utils.startup_profiler import profiler
+from core.utils.metadata_watcher import MetadataWatcher
+from core.utils.vault_registry import DEFAULT_VAULT, VaultRegistry
 
 
 class MainWindow(QMainWindow):
@@ -36,8 +43,29 @@ class MainWindow(QMainWindow):
         super().__init__(parent)
         self.config = MainWindowConfig()
         self.styles = MainWindowStyles()
-        self.smart_pass_man = SmartPasswordManager()
-        self.setWindowTitle(f'{self.config.app_name} {self.config.version}')
+        with profiler.phase('load metadata'):
+            self.vaults = VaultRegistry()
+            try:
+                vault = self.vaults.open(self.vaults.active)
+            except (OSError, ValueError) as e:
+                warnings.warn(f'Failed to open vault "{self.vaults.active}": {e}')
+                vault = self.vaults.activate(DEFAULT_VAULT)
+        self.smart_pass_man = vault.smart_pass_man
+        self.metadata_writer = vault.writer
+        # Running derivations and their progress dialogs. Cancelled workers
+        # stay referenced until they report, since a result may already be
+        # queued for them.
+        self._derivation_workers = {}
+        self._retired_derivations = set()
+        self.secret_cache = SecretCache()
+        self.secret_cache_timer = QTimer(self)
+        self.secret_cache_timer.timeout.connect(self.secret_cache.purge_expired)
+        self.secret_cache_timer.start(30000)
+        self.tray_icon = None
+        self._tray_hint_shown = False
+        self._quitting = False
+        self._quick_retrieve_dialog = None
+        self.update_window_title()
         self.resize(800, 600)
 
         self.setup_application_icon()
@@ -45,17 +73,12 @@ class MainWindow(QMainWindow):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
 
-        self.click_sound = QSound("data/sounds/click.wav")
-        self.about_sound = QSound("data/sounds/about.wav")
-        self.notify_sound = QSound("data/sounds/notify.wav")
-        self.error_sound = QSound("data/sounds/error.wav")
-
         self.sound_manager = SoundManager()
 
-        self.sound_manager.register_sound('click', self.click_sound)
-        self.sound_manager.register_sound('about', self.about_sound)
-        self.sound_manager.register_sound('notify', self.notify_sound)
-        self.sound_manager.register_sound('error', self.error_sound)
+        self.sound_manager.register_sound('click', "data/sounds/click.wav")
+        self.sound_manager.register_sound('about', "data/sounds/about.wav")
+        self.sound_manager.register_sound('notify', "data/sounds/notify.wav")
+        self.sound_manager.register_sound('error', "data/sounds/error.wav")
 
         self.main_layout = QVBoxLayout(central_widget)
         self.main_layout.setSpacing(15)
@@ -64,7 +87,8 @@ class MainWindow(QMainWindow):
         self.menu_bar = QMenuBar()
         self.main_layout.setMenuBar(self.menu_bar)
 
-        self.setup_menu_bar()
+        with profiler.phase('setup_menu_bar'):
+            self.setup_menu_bar()
 
         header_layout = QHBoxLayout()
         self.label_logo = QLabel(f"{self.config.app_name}")
@@ -83,21 +107,58 @@ class MainWindow(QMainWindow):
 
         self.main_layout.addLayout(header_layout)
 
-        self.table_widget = QTableWidget()
-        self.table_widget.setColumnCount(5)
-        self.table_widget.setHorizontalHeaderLabels(['Description', 'Length', 'Get', 'Edit', 'Delete'])
-        self.table_widget.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table_widget.setSelectionMode(QTableWidget.SingleSelection)
-        self.table_widget.setAlternatingRowColors(True)
-        self.table_widget.setStyleSheet(self.styles.table_widget_style)
-
-        self.table_widget.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.table_widget.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.table_widget.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        self.table_widget.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        self.table_widget.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeToContents)
-
-        self.main_layout.addWidget(self.table_widget)
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText('Search by description...')
+        self.filter_input.setClearButtonEnabled(True)
+        self.filter_input.textChanged.connect(self.apply_filter)
+        self.main_layout.addWidget(self.filter_input)
+
+        self.table_model = PasswordTableModel(self.smart_pass_man, self)
+        self.proxy_model = PasswordFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.table_model)
+        self.table_model.rowsInserted.connect(self.refresh_filter)
+        self.table_model.dataChanged.connect(self.refresh_filter)
+        self.table_model.modelReset.connect(self.refresh_filter)
+        self.table_model.filter_outdated.connect(self.refresh_filter)
+
+        self.table_view = QTableView()
+        self.table_view.setModel(self.proxy_model)
+        self.table_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table_view.setAlternatingRowColors(True)
+        self.table_view.setMouseTracking(True)
+        self.table_view.setStyleSheet(self.styles.table_view_style)
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_view.verticalHeader().setDefaultSectionSize(36)
+
+        self.get_delegate = ActionButtonDelegate(self.table_view, self.styles.get_button_color, 90)
+        self.get_delegate.clicked.connect(self.sound_manager.play_click)
+        self.get_delegate.clicked.connect(lambda index: self._execute_action_for_index(index, 'get'))
+        self.table_view.setItemDelegateForColumn(PasswordTableModel.GET_COLUMN, self.get_delegate)
+
+        self.edit_delegate = ActionButtonDelegate(self.table_view, self.styles.edit_button_color, 90)
+        self.edit_delegate.clicked.connect(self.sound_manager.play_click)
+        self.edit_delegate.clicked.connect(lambda index: self._execute_action_for_index(index, 'edit'))
+        self.table_view.setItemDelegateForColumn(PasswordTableModel.EDIT_COLUMN, self.edit_delegate)
+
+        self.delete_delegate = ActionButtonDelegate(self.table_view, self.styles.delete_button_color, 80)
+        self.delete_delegate.clicked.connect(self.sound_manager.play_click)
+        self.delete_delegate.clicked.connect(lambda index: self._execute_action_for_index(index, 'delete'))
+        self.table_view.setItemDelegateForColumn(PasswordTableModel.DELETE_COLUMN, self.delete_delegate)
+
+        header = self.table_view.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Fixed)
+        header.setSectionResizeMode(PasswordTableModel.DESCRIPTION_COLUMN, QHeaderView.Stretch)
+        header.resizeSection(PasswordTableModel.LENGTH_COLUMN, 90)
+        header.resizeSection(PasswordTableModel.GET_COLUMN, 90)
+        header.resizeSection(PasswordTableModel.EDIT_COLUMN, 90)
+        header.resizeSection(PasswordTableModel.DELETE_COLUMN, 80)
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        header.sortIndicatorChanged.connect(self.on_sort_indicator_changed)
+        self.table_view.setSortingEnabled(True)
+
+        self.main_layout.addWidget(self.table_view)
 
         self.setup_table_context_menu()
 
@@ -127,7 +188,7 @@ class MainWindow(QMainWindow):
 
         self.btn_exit = QPushButton("Exit")
         self.btn_exit.setMinimumHeight(40)
-        self.btn_exit.clicked.connect(self.close)
+        self.btn_exit.clicked.connect(self.quit_application)
         self.btn_exit.setStyleSheet(self.styles.btn_exit_style)
         button_layout.addWidget(self.btn_exit)
 
@@ -153,9 +214,14 @@ class MainWindow(QMainWindow):
 
         self.main_layout.addLayout(footer_layout)
 
-        self._init()
+        with profiler.phase('_init table population'):
+            self._init()
         self.center_window()
 
+        self.metadata_watcher = MetadataWatcher(self.smart_pass_man, self.metadata_writer, parent=self)
+        self.metadata_watcher.changed.connect(self.apply_external_changes)
+        self.metadata_watcher.failed.connect(self.on_external_change_failed)
+
     def setup_application_icon(self):
         icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "icons", "icon.png")
 
@@ -201,11 +267,31 @@ class MainWindow(QMainWindow):
 
         import_menu.addSeparator()
 
+        self.binary_storage_action = QAction('Compact Binary Storage', self)
+        self.binary_storage_action.setCheckable(True)
+        self.binary_storage_action.setChecked(is_store_path(self.smart_pass_man.filename))
+        self.binary_storage_action.triggered.connect(self.sound_manager.play_click)
+        self.binary_storage_action.triggered.connect(
+            lambda enabled: self.set_binary_storage(enabled, self.binary_storage_action)
+        )
+        file_menu.addAction(self.binary_storage_action)
+
+        self.tray_action = QAction('Keep Running in Tray', self)
+        self.tray_action.setCheckable(True)
+        self.tray_action.triggered.connect(self.sound_manager.play_click)
+        self.tray_action.triggered.connect(self.set_tray_mode)
+        file_menu.addAction(self.tray_action)
+        file_menu.addSeparator()
+
         exit_action = QAction('Exit', self)
         exit_action.setShortcut('Ctrl+Q')
-        exit_action.triggered.connect(self.close)
+        exit_action.triggered.connect(self.quit_application)
         file_menu.addAction(exit_action)
 
+        # Rebuilt each time it opens, so it always lists the current vaults.
+        self.vaults_menu = self.menu_bar.addMenu('Vaults')
+        self.vaults_menu.aboutToShow.connect(self.populate_vaults_menu)
+
         passwords_menu = self.menu_bar.addMenu('Passwords')
 
         create_pass_action = QAction('Create new password', self)
@@ -214,6 +300,12 @@ class MainWindow(QMainWindow):
         create_pass_action.triggered.connect(self.add_password)
         passwords_menu.addAction(create_pass_action)
 
+        quick_retrieve_action = QAction('Quick Retrieve...', self)
+        quick_retrieve_action.setShortcut('Ctrl+R')
+        quick_retrieve_action.triggered.connect(self.sound_manager.play_click)
+        quick_retrieve_action.triggered.connect(self.show_quick_retrieve)
+        passwords_menu.addAction(quick_retrieve_action)
+
         sounds_menu = self.menu_bar.addMenu('Sounds')
 
         sound_action = QAction('Enable Sounds', self)
@@ -248,10 +340,11 @@ class MainWindow(QMainWindow):
         help_menu.addAction(help_action)
 
     def setup_table_context_menu(self):
-        self.table_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.table_widget.customContextMenuRequested.connect(self.show_table_context_menu)
+        self.table_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.table_view.customContextMenuRequested.connect(self.show_table_context_menu)
 
         shortcuts = [
+            ('Ctrl+F', 'Search Passwords', self.focus_filter),
             ('Ctrl+G', 'Get Password', self.get_password_for_selected_row),
             ('Ctrl+Shift+E', 'Edit Password', self.edit_password_for_selected_row),
             ('Del', 'Delete Password', self.delete_selected_row)
@@ -263,19 +356,22 @@ class MainWindow(QMainWindow):
             action.triggered.connect(callback)
             self.addAction(action)
 
-    def _get_public_key_for_row(self, row):
-        if row < 0:
+    def _get_public_key_for_index(self, index):
+        if not index.isValid():
             return None
+        return index.data(PasswordTableModel.PUBLIC_KEY_ROLE)
 
-        for col in [2, 3, 4]:
-            widget = self.table_widget.cellWidget(row, col)
-            if widget and hasattr(widget, 'public_key'):
-                return widget.public_key
-        return None
+    def _get_selected_public_keys(self):
+        return [
+            self._get_public_key_for_index(index)
+            for index in self.table_view.selectionModel().selectedRows(PasswordTableModel.DESCRIPTION_COLUMN)
+        ]
 
     def _execute_action_for_selected_row(self, action_name):
-        current_row = self.table_widget.currentRow()
-        public_key = self._get_public_key_for_row(current_row)
+        self._execute_action_for_index(self.table_view.currentIndex(), action_name)
+
+    def _execute_action_for_index(self, index, action_name):
+        public_key = self._get_public_key_for_index(index)
 
         if not public_key:
             self.show_status_message('No row selected', 2000)
@@ -292,7 +388,11 @@ class MainWindow(QMainWindow):
             getattr(self, method_name)(public_key)
 
     def get_password_for_selected_row(self):
-        self._execute_action_for_selected_row('get')
+        public_keys = self._get_selected_public_keys()
+        if len(public_keys) > 1:
+            self.get_passwords(public_keys)
+        else:
+            self._execute_action_for_selected_row('get')
 
     def edit_password_for_selected_row(self):
         self._execute_action_for_selected_row('edit')
@@ -301,24 +401,19 @@ class MainWindow(QMainWindow):
         self._execute_action_for_selected_row('delete')
 
     def show_table_context_menu(self, position):
-        item = self.table_widget.itemAt(position)
-        if not item:
-            return
-
-        row = item.row()
-        public_key = None
-
-        for col in [2, 3, 4]:
-            widget = self.table_widget.cellWidget(row, col)
-            if widget and hasattr(widget, 'public_key'):
-                public_key = widget.public_key
-                break
+        public_key = self._get_public_key_for_index(self.table_view.indexAt(position))
 
         if not public_key:
             return
 
         context_menu = QMenu(self)
 
+        selected_public_keys = self._get_selected_public_keys()
+        if len(selected_public_keys) > 1 and public_key in selected_public_keys:
+            get_selected_action = context_menu.addAction(f"🔑 Get {len(selected_public_keys)} Selected Passwords")
+            get_selected_action.setShortcut("Ctrl+G")
+            get_selected_action.triggered.connect(lambda checked: self.get_passwords(selected_public_keys))
+
         get_action = context_menu.addAction("🔑 Get Password")
         get_action.setShortcut("Ctrl+G")
         get_action.triggered.connect(lambda checked, pk=public_key: self.get_password(pk))
@@ -333,7 +428,27 @@ class MainWindow(QMainWindow):
         delete_action.setShortcut("Del")
         delete_action.triggered.connect(lambda checked, pk=public_key: self.remove_password(pk))
 
-        context_menu.exec_(self.table_widget.viewport().mapToGlobal(position))
+        context_menu.exec_(self.table_view.viewport().mapToGlobal(position))
+
+    def focus_filter(self):
+        self.filter_input.setFocus()
+        self.filter_input.selectAll()
+
+    def apply_filter(self, text):
+        self.proxy_model.set_public_keys(self.table_model.description_index.search(text))
+        if text.strip():
+            self.show_status_message(f'{self.proxy_model.rowCount()} matching passwords', 2000)
+
+    def refresh_filter(self):
+        if self.filter_input.text().strip():
+            self.apply_filter(self.filter_input.text())
+
+    def on_sort_indicator_changed(self, column, order):
+        if not self.table_model.is_sortable(column):
+            self.table_view.horizontalHeader().setSortIndicator(
+                self.table_model.sort_column,
+                self.table_model.sort_order
+            )
 
     def center_window(self):
         frame = self.frameGeometry()
@@ -342,10 +457,8 @@ class MainWindow(QMainWindow):
         self.move(frame.topLeft())
 
     def _init(self):
-        self.table_widget.setRowCount(0)
+        self.table_model.reload()
         self.update_password_count()
-        for password in self.smart_pass_man.passwords.values():
-            self.add_item(password)
         self.show_status_message(f'Loaded {self.smart_pass_man.password_count} passwords', 3000)
 
     def show_help(self):
@@ -434,47 +547,36 @@ class MainWindow(QMainWindow):
         self.count_label.setText(f"{count} password{'s' if count != 1 else ''}")
 
     def add_item(self, smart_password):
-        row_position = self.table_widget.rowCount()
-        self.table_widget.insertRow(row_position)
-
-        desc_item = QTableWidgetItem(smart_password.description)
-        desc_item.setToolTip(smart_password.description)
-        self.table_widget.setItem(row_position, 0, desc_item)
-
-        length_item = QTableWidgetItem(f"{smart_password.length} chars")
-        length_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.table_widget.setItem(row_position, 1, length_item)
-
-        get_button = QPushButton("Get")
-        get_button.setToolTip("Get Smart Password")
-        get_button.setStyleSheet(self.styles.get_button_style)
-        get_button.clicked.connect(self.sound_manager.play_click)
-        get_button.clicked.connect(lambda checked, pk=smart_password.public_key:
-                                   self.get_password(pk))
-        get_button.public_key = smart_password.public_key
-        self.table_widget.setCellWidget(row_position, 2, get_button)
-
-        edit_button = QPushButton("Edit")
-        edit_button.setToolTip("Edit password description and length")
-        edit_button.setStyleSheet(self.styles.edit_button_style)
-        edit_button.clicked.connect(self.sound_manager.play_click)
-        edit_button.clicked.connect(lambda checked, pk=smart_password.public_key:
-                                    self.edit_password(pk))
-        edit_button.public_key = smart_password.public_key
-        self.table_widget.setCellWidget(row_position, 3, edit_button)
-
-        delete_button = QPushButton("Delete")
-        delete_button.setToolTip("Delete this password entry")
-        delete_button.setStyleSheet(self.styles.delete_button_style)
-        delete_button.clicked.connect(self.sound_manager.play_click)
-        delete_button.clicked.connect(lambda checked, pk=smart_password.public_key:
-                                      self.remove_password(pk))
-        delete_button.public_key = smart_password.public_key
-        self.table_widget.setCellWidget(row_position, 4, delete_button)
+        self.table_model.add_password(smart_password)
+        self.update_password_count()
+
+    def add_items(self, public_keys):
+        self.table_model.add_passwords(public_keys)
+        self.update_password_count()
+
+    def update_items(self, public_keys):
+        self.table_model.update_passwords(public_keys)
 
+    def apply_external_changes(self, diff):
+        self.table_model.add_passwords([smart_password.public_key for smart_password in diff.added])
+        self.table_model.update_passwords([public_key for public_key, _, _ in diff.updated])
+        removed = [public_key for public_key, _ in diff.removed]
+        self.table_model.remove_passwords(removed)
+        for public_key in removed:
+            self.secret_cache.discard(public_key)
         self.update_password_count()
+        self.show_status_message(
+            f'Reloaded changes from disk: {len(diff.added)} added, '
+            f'{len(diff.updated)} updated, {len(removed)} removed',
+            5000
+        )
+
+    def on_external_change_failed(self, error):
+        self.show_status_message(f'Could not reload password metadata: {error}', 5000)
 
     def edit_password(self, public_key):
+        from core.dialogs.edit_password_dialog import EditPasswordDialog
+
         self.sound_manager.play_notify()
         smart_password = self.smart_pass_man.get_smart_password(public_key)
         if not smart_password:
@@ -521,16 +623,7 @@ class MainWindow(QMainWindow):
                 )
 
                 if success:
-                    row = self.find_row_by_public_key(public_key)
-                    if row != -1:
-                        desc_item = self.table_widget.item(row, 0)
-                        if desc_item:
-                            desc_item.setText(new_description)
-                            desc_item.setToolTip(new_description)
-
-                        length_item = self.table_widget.item(row, 1)
-                        if length_item:
-                            length_item.setText(f"{new_length} chars")
+                    self.table_model.update_password(public_key)
                     self.show_status_message('Password metadata updated', 3000)
 
                     msg_box = QMessageBox(self)
@@ -559,9 +652,9 @@ class MainWindow(QMainWindow):
 
     def remove_password(self, public_key):
         self.sound_manager.play_notify()
-        row = self.find_row_by_public_key(public_key)
-        if row != -1:
-            description = self.table_widget.item(row, 0).text()
+        smart_password = self.smart_pass_man.get_smart_password(public_key)
+        if smart_password:
+            description = smart_password.description
 
             msg_box = QMessageBox(self)
             msg_box.setWindowTitle('Confirm Deletion')
@@ -578,8 +671,9 @@ class MainWindow(QMainWindow):
             reply = msg_box.exec_()
 
             if reply == QMessageBox.Yes:
-                self.table_widget.removeRow(row)
                 self.smart_pass_man.delete_smart_password(public_key)
+                self.table_model.remove_password(public_key)
+                self.secret_cache.discard(public_key)
                 self.update_password_count()
 
                 msg_box = QMessageBox(self)
@@ -592,14 +686,75 @@ class MainWindow(QMainWindow):
                 msg_box.exec_()
 
     def find_row_by_public_key(self, public_key):
-        for row in range(self.table_widget.rowCount()):
-            for col in [2, 3, 4]:
-                widget = self.table_widget.cellWidget(row, col)
-                if widget and hasattr(widget, 'public_key') and widget.public_key == public_key:
-                    return row
-        return -1
+        return self.table_model.row_for_public_key(public_key)
+
+    def start_derivation(self, func, args, on_finished, on_failed):
+        worker = DerivationWorker(func, *args)
+
+        progress = QProgressDialog('Deriving password...', 'Cancel', 0, 0, self)
+        progress.setWindowTitle('Please wait')
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(300)
+
+        def cancel():
+            if worker not in self._derivation_workers:
+                return
+            self._retire_derivation(worker)
+            self.show_status_message('Password derivation cancelled', 3000)
+
+        def finish(handler, result):
+            if worker not in self._derivation_workers:
+                self._retired_derivations.discard(worker)
+                return
+            del self._derivation_workers[worker]
+            progress.reset()
+            progress.deleteLater()
+            handler(result)
+
+        progress.canceled.connect(cancel)
+        worker.signals.finished.connect(lambda result: finish(on_finished, result))
+        worker.signals.failed.connect(lambda error: finish(on_failed, error))
+
+        self._derivation_workers[worker] = progress
+        self.show_status_message('Deriving password...', 0)
+        QThreadPool.globalInstance().start(worker)
+        return worker
+
+    def _retire_derivation(self, worker):
+        worker.cancel()
+        progress = self._derivation_workers.pop(worker)
+        self._retired_derivations.add(worker)
+        progress.deleteLater()
+
+    def cancel_derivations(self):
+        for worker in list(self._derivation_workers):
+            self._retire_derivation(worker)
+
+    def _derive_new_password(self, secret, length):
+        public_key, private_key = derive_keys(secret)
+        self.secret_cache.put(public_key, secret, private_key)
+        return public_key, expand_password(private_key, length)
+
+    def _derive_existing_password(self, secret, public_key, length):
+        private_key = self.secret_cache.get_private_key(public_key, secret)
+        if private_key is None:
+            private_key = verify_secret(secret, public_key)
+            if private_key is None:
+                return False, None
+            self.secret_cache.put(public_key, secret, private_key)
+        return True, expand_password(private_key, length)
+
+    def _derive_batch_password(self, secret, lengths):
+        public_key, private_key = derive_keys(secret)
+        length = lengths.get(public_key)
+        if length is None:
+            return public_key, None
+        self.secret_cache.put(public_key, secret, private_key)
+        return public_key, expand_password(private_key, length)
 
     def add_password(self):
+        from core.dialogs.password_input_dialog import PasswordInputDialog
+
         self.sound_manager.play_notify()
         dialog = PasswordInputDialog(self, self.sound_manager)
         if dialog.exec_() == QDialog.Accepted:
@@ -613,55 +768,63 @@ class MainWindow(QMainWindow):
                 )
                 return
 
-            try:
-                public_key = SmartPasswordMaster.generate_public_key(secret=secret)
+            self.start_derivation(
+                self._derive_new_password,
+                (secret, length),
+                lambda result: self._on_new_password_derived(description, length, *result),
+                self._on_add_password_failed
+            )
 
-                if public_key in self.smart_pass_man.passwords:
-                    existing_password = self.smart_pass_man.passwords[public_key]
-                    msg_box = QMessageBox(self)
-                    msg_box.setWindowTitle('Duplicate Secret Phrase')
-                    msg_box.setTextFormat(Qt.TextFormat.RichText)
-                    msg_box.setText(
-                        f'A password entry with this secret phrase already exists:<br><br>'
-                        f'<b>"{existing_password.description}"</b><br>'
-                        f'Length: {existing_password.length} characters<br><br>'
-                        f'Each unique secret phrase generates a unique public key.<br>'
-                        f'You cannot have multiple entries with the same secret.'
-                    )
-                    msg_box.setIcon(QMessageBox.Warning)
-                    msg_box.setStandardButtons(QMessageBox.Ok)
-                    msg_box.exec_()
-                    self.show_status_message('Duplicate secret phrase detected', 3000)
-                    return
+    def _on_new_password_derived(self, description, length, public_key, password):
+        from core.dialogs.password_display_dialog import PasswordDisplayDialog
 
-                smart_password = SmartPassword(
-                    public_key=public_key,
-                    description=description,
-                    length=length
+        try:
+            if public_key in self.smart_pass_man.passwords:
+                existing_password = self.smart_pass_man.passwords[public_key]
+                msg_box = QMessageBox(self)
+                msg_box.setWindowTitle('Duplicate Secret Phrase')
+                msg_box.setTextFormat(Qt.TextFormat.RichText)
+                msg_box.setText(
+                    f'A password entry with this secret phrase already exists:<br><br>'
+                    f'<b>"{existing_password.description}"</b><br>'
+                    f'Length: {existing_password.length} characters<br><br>'
+                    f'Each unique secret phrase generates a unique public key.<br>'
+                    f'You cannot have multiple entries with the same secret.'
                 )
+                msg_box.setIcon(QMessageBox.Warning)
+                msg_box.setStandardButtons(QMessageBox.Ok)
+                msg_box.exec_()
+                self.show_status_message('Duplicate secret phrase detected', 3000)
+                return
 
-                password = SmartPasswordMaster.generate_smart_password(
-                    secret=secret,
-                    length=length
-                )
+            smart_password = SmartPassword(
+                public_key=public_key,
+                description=description,
+                length=length
+            )
 
-                self.smart_pass_man.add_smart_password(smart_password)
+            self.smart_pass_man.add_smart_password(smart_password)
 
-                self.add_item(smart_password)
-                self.show_status_message(f'Password created for "{description}"', 3000)
+            self.add_item(smart_password)
+            self.show_status_message(f'Password created for "{description}"', 3000)
 
-                display_dialog = PasswordDisplayDialog(self, description, password, self.sound_manager)
-                display_dialog.exec_()
+            display_dialog = PasswordDisplayDialog(self, description, password, self.sound_manager)
+            display_dialog.exec_()
 
-            except Exception as e:
-                self.show_status_message('Failed to create password', 3000)
-                QMessageBox.critical(
-                    self,
-                    'Error',
-                    f'Failed to create password:\n{str(e)}'
-                )
+        except Exception as e:
+            self._on_add_password_failed(str(e))
+
+    def _on_add_password_failed(self, error):
+        self.show_status_message('Failed to create password', 3000)
+        QMessageBox.critical(
+            self,
+            'Error',
+            f'Failed to create password:\n{error}'
+        )
 
     def get_password(self, public_key):
+        from core.dialogs.secret_input_dialog import SecretInputDialog
+
         self.sound_manager.play_notify()
         smart_password = self.smart_pass_man.get_smart_password(public_key)
         if not smart_password:
@@ -687,44 +850,61 @@ class MainWindow(QMainWindow):
                 )
                 return
 
-            try:
-                is_valid = SmartPasswordMaster.check_public_key(
-                    secret=secret,
-                    public_key=public_key
-                )
+            self.start_derivation(
+                self._derive_existing_password,
+                (secret, public_key, smart_password.length),
+                lambda result: self._on_existing_password_derived(description, *result),
+                self._on_get_password_failed
+            )
 
-                if is_valid:
-                    password = SmartPasswordMaster.generate_smart_password(
-                        secret=secret,
-                        length=smart_password.length
-                    )
-                    self.show_status_message(f'Password retrieved for "{description}"', 3000)
-                    display_dialog = PasswordDisplayDialog(self, description, password, self.sound_manager)
-                    display_dialog.exec_()
-
-                else:
-                    self.show_status_message('Invalid secret phrase', 3000)
-                    msg_box = QMessageBox(self)
-                    msg_box.setWindowTitle('Invalid Secret')
-                    msg_box.setTextFormat(Qt.TextFormat.RichText)
-                    msg_box.setText(
-                        'The secret phrase is incorrect. Please check:<br>'
-                        '• Caps Lock<br>'
-                        '• Keyboard layout<br>'
-                        '• Spelling<br><br>'
-                        f'Note: In {self.config.version}, secret phrases are case-sensitive.'
-                    )
-                    msg_box.setIcon(QMessageBox.Warning)
-                    msg_box.setStandardButtons(QMessageBox.Ok)
-                    msg_box.exec_()
+    def get_passwords(self, public_keys):
+        from core.dialogs.batch_get_dialog import BatchGetDialog
 
-            except Exception as e:
-                self.show_status_message('Failed to generate password', 3000)
-                QMessageBox.critical(
-                    self,
-                    'Error',
-                    f'Failed to generate password:\n{str(e)}'
-                )
+        self.sound_manager.play_notify()
+        smart_passwords = [
+            self.smart_pass_man.passwords[public_key]
+            for public_key in public_keys
+            if public_key in self.smart_pass_man.passwords
+        ]
+        if not smart_passwords:
+            self.show_status_message('No row selected', 2000)
+            return
+
+        dialog = BatchGetDialog(self, smart_passwords, self._derive_batch_password, self.sound_manager)
+        dialog.exec_()
+        self.show_status_message(f'Retrieved {dialog.matched} of {len(smart_passwords)} passwords', 3000)
+
+    def _on_existing_password_derived(self, description, is_valid, password):
+        if is_valid:
+            from core.dialogs.password_display_dialog import PasswordDisplayDialog
+
+            self.show_status_message(f'Password retrieved for "{description}"', 3000)
+            display_dialog = PasswordDisplayDialog(self, description, password, self.sound_manager)
+            display_dialog.exec_()
+
+        else:
+            self.show_status_message('Invalid secret phrase', 3000)
+            msg_box = QMessageBox(self)
+            msg_box.setWindowTitle('Invalid Secret')
+            msg_box.setTextFormat(Qt.TextFormat.RichText)
+            msg_box.setText(
+                'The secret phrase is incorrect. Please check:<br>'
+                '• Caps Lock<br>'
+                '• Keyboard layout<br>'
+                '• Spelling<br><br>'
+                f'Note: In {self.config.version}, secret phrases are case-sensitive.'
+            )
+            msg_box.setIcon(QMessageBox.Warning)
+            msg_box.setStandardButtons(QMessageBox.Ok)
+            msg_box.exec_()
+
+    def _on_get_password_failed(self, error):
+        self.show_status_message('Failed to generate password', 3000)
+        QMessageBox.critical(
+            self,
+            'Error',
+            f'Failed to generate password:\n{error}'
+        )
 
     def toggle_sounds(self, enabled: bool):
         self.sound_manager.set_enabled(enabled)
@@ -753,18 +933,236 @@ class MainWindow(QMainWindow):
             smart_pass_man=self.smart_pass_man,
             sound_manager=self.sound_manager
         )
+        dialog.passwords_imported.connect(self.add_items)
+        dialog.passwords_updated.connect(self.update_items)
 
         if dialog.exec_() == QDialog.Accepted:
-            self.refresh_table()
-            self.update_password_count()
             self.show_status_message(f'Passwords imported successfully. '
                                      f'Total: {self.smart_pass_man.password_count}', 3000)
 
-    def refresh_table(self):
-        self.table_widget.setRowCount(0)
+    def set_binary_storage(self, enabled, action):
+        if not self.metadata_writer.flush(self.vaults.write_timeout):
+            action.setChecked(not enabled)
+            QMessageBox.critical(
+                self,
+                'Storage Error',
+                'Pending changes are still being saved. Please try again.'
+            )
+            return
+
+        # Only the Default vault uses the default paths; a named vault is
+        # converted next to its own file.
+        target = None
+        if self.vaults.current.filename is not None:
+            target = os.path.splitext(self.smart_pass_man.filename)[0] + (STORE_SUFFIX if enabled else '.json')
+        try:
+            if enabled:
+                filename = convert_to_binary_store(self.smart_pass_man, target)
+            else:
+                filename = convert_to_json(self.smart_pass_man, target)
+        except (OSError, ValueError) as e:
+            action.setChecked(not enabled)
+            QMessageBox.critical(
+                self,
+                'Storage Error',
+                f'Failed to convert password storage:\n{e}'
+            )
+            return
+
+        self.metadata_watcher.watch()
+        if self.vaults.current.filename is not None:
+            self.vaults.current.filename = filename
+            self.vaults.save()
+        self.show_status_message(f'Passwords are now stored in {filename}', 5000)
+
+    @property
+    def tray_mode(self):
+        return self.tray_icon is not None and self.tray_icon.isVisible()
+
+    def setup_tray_icon(self):
+        icon = self.windowIcon()
+        if icon.isNull():
+            icon = self.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon)
+        self.tray_icon = QSystemTrayIcon(icon, self)
+        self.tray_icon.setToolTip(self.config.app_name)
+
+        tray_menu = QMenu(self)
+        quick_retrieve_action = tray_menu.addAction('Quick Retrieve...')
+        quick_retrieve_action.triggered.connect(self.show_quick_retrieve)
+        show_action = tray_menu.addAction('Show Window')
+        show_action.triggered.connect(self.bring_to_front)
+        tray_menu.addSeparator()
+        quit_action = tray_menu.addAction('Quit')
+        quit_action.triggered.connect(self.quit_application)
+        self.tray_icon.setContextMenu(tray_menu)
+        self.tray_icon.activated.connect(self.on_tray_activated)
+
+    def set_tray_mode(self, enabled):
+        # In tray mode closing the window only hides it: the process stays
+        # warm with the vault and its search index loaded.
+        if enabled and not QSystemTrayIcon.isSystemTrayAvailable():
+            self.tray_action.setChecked(False)
+            self.show_status_message('No system tray is available', 3000)
+            return False
+
+        if enabled and self.tray_icon is None:
+            self.setup_tray_icon()
+        if self.tray_icon is not None:
+            self.tray_icon.setVisible(enabled)
+        QApplication.instance().setQuitOnLastWindowClosed(not enabled)
+        self.tray_action.setChecked(enabled)
+        return True
+
+    def on_tray_activated(self, reason):
+        if reason == QSystemTrayIcon.ActivationReason.Trigger:
+            self.show_quick_retrieve()
+        elif reason == QSystemTrayIcon.ActivationReason.DoubleClick:
+            self.bring_to_front()
+
+    def show_quick_retrieve(self):
+        from core.dialogs.quick_retrieve_dialog import QuickRetrieveDialog
+
+        if self._quick_retrieve_dialog is not None:
+            self._quick_retrieve_dialog.show_centered()
+            return
+
+        dialog = QuickRetrieveDialog(
+            self,
+            self.smart_pass_man,
+            self.table_model.description_index,
+            self._derive_existing_password,
+            self.sound_manager
+        )
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.password_copied.connect(self.on_quick_retrieve_copied)
+        dialog.finished.connect(self.on_quick_retrieve_finished)
+        self._quick_retrieve_dialog = dialog
+        dialog.show_centered()
+
+    def on_quick_retrieve_copied(self, description):
+        self.show_status_message(f'Password for "{description}" copied to clipboard', 3000)
+
+    def on_quick_retrieve_finished(self, result):
+        self._quick_retrieve_dialog = None
+
+    def quit_application(self):
+        self._quitting = True
+        if not self.close():
+            self._quitting = False
+
+    def bring_to_front(self):
+        self.setWindowState((self.windowState() & ~Qt.WindowState.WindowMinimized) | Qt.WindowState.WindowActive)
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def update_window_title(self):
+        title = f'{self.config.app_name} {self.config.version}'
+        if self.vaults.active != DEFAULT_VAULT:
+            title = f'{title} - {self.vaults.active}'
+        self.setWindowTitle(title)
+
+    def populate_vaults_menu(self):
+        self.vaults_menu.clear()
+
+        group = QActionGroup(self.vaults_menu)
+        for name in self.vaults.names():
+            vault_action = QAction(name, self.vaults_menu)
+            vault_action.setCheckable(True)
+            vault_action.setChecked(name == self.vaults.active)
+            vault = self.vaults.get(name)
+            vault_action.setToolTip(vault.filename or 'Default metadata file')
+            vault_action.triggered.connect(self.sound_manager.play_click)
+            vault_action.triggered.connect(lambda checked, name=name: self.switch_vault(name))
+            group.addAction(vault_action)
+            self.vaults_menu.addAction(vault_action)
+
+        self.vaults_menu.addSeparator()
+
+        open_action = QAction('Open Vault File...', self.vaults_menu)
+        open_action.triggered.connect(self.sound_manager.play_click)
+        open_action.triggered.connect(self.open_vault_file)
+        self.vaults_menu.addAction(open_action)
+
+        remove_menu = self.vaults_menu.addMenu('Remove from List')
+        removable = [name for name in self.vaults.names() if name not in (DEFAULT_VAULT, self.vaults.active)]
+        remove_menu.setEnabled(bool(removable))
+        for name in removable:
+            remove_action = QAction(name, remove_menu)
+            remove_action.triggered.connect(lambda checked, name=name: self.remove_vault(name))
+            remove_menu.addAction(remove_action)
+
+    def open_vault_file(self):
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            'Open or Create Vault',
+            str(os.path.dirname(self.smart_pass_man.filename)),
+            'Password Metadata (*.json *.bin);;All Files (*)',
+            options=QFileDialog.DontConfirmOverwrite
+        )
+        if not file_path:
+            return
+
+        name = self.vaults.name_for_file(file_path)
+        if name is None:
+            name, ok = QInputDialog.getText(
+                self,
+                'Vault Name',
+                'Name for this vault:',
+                QLineEdit.Normal,
+                os.path.splitext(os.path.basename(file_path))[0]
+            )
+            name = name.strip()
+            if not ok or not name:
+                return
+            try:
+                self.vaults.add(name, file_path)
+            except (OSError, ValueError) as e:
+                QMessageBox.critical(self, 'Vault Error', f'Failed to open vault "{name}":\n{e}')
+                return
+
+        self.switch_vault(name)
+
+    def remove_vault(self, name):
+        try:
+            self.vaults.remove(name)
+        except ValueError as e:
+            QMessageBox.warning(self, 'Vaults', str(e))
+            return
+        self.show_status_message(f'Vault "{name}" removed from the list; its file was kept', 3000)
+
+    def switch_vault(self, name):
+        if name == self.vaults.active:
+            return
+
+        # The outgoing vault stays cached; save it first so that it matches
+        # its file while inactive.
+        self.cancel_derivations()
+        if self._quick_retrieve_dialog is not None:
+            self._quick_retrieve_dialog.reject()
+        previous = self.vaults.current
+        previous.writer.flush(self.vaults.write_timeout)
+        previous.signature = self.metadata_watcher.synced_signature()
+
+        try:
+            vault = self.vaults.activate(name)
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, 'Vault Error', f'Failed to open vault "{name}":\n{e}')
+            return
 
-        for password in self.smart_pass_man.passwords.values():
-            self.add_item(password)
+        self.smart_pass_man = vault.smart_pass_man
+        self.metadata_writer = vault.writer
+        self.table_model.set_manager(vault.smart_pass_man)
+        self.metadata_watcher.set_manager(vault.smart_pass_man, vault.writer, vault.signature)
+        self.binary_storage_action.setChecked(is_store_path(self.smart_pass_man.filename))
+        self.refresh_filter()
+        self.update_password_count()
+        self.update_window_title()
+        self.show_status_message(f'Switched to vault "{name}" ({self.smart_pass_man.password_count} passwords)', 3000)
+
+    def refresh_table(self):
+        self.table_model.reload()
+        self.update_password_count()
 
     def show_status_message(self, message, duration=3000):
         self.status_bar.showMessage(message, duration)
@@ -787,6 +1185,24 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage(messages.get(action_name, 'Action completed'), 3000)
 
     def closeEvent(self, event):
+        if self.tray_mode and not self._quitting:
+            # Hiding counts as closing for the secrets held in memory.
+            self.cancel_derivations()
+            if self._quick_retrieve_dialog is not None:
+                self._quick_retrieve_dialog.reject()
+            self.secret_cache.clear()
+            self.hide()
+            if not self._tray_hint_shown:
+                self._tray_hint_shown = True
+                self.tray_icon.showMessage(
+                    self.config.app_name,
+                    'Still running in the tray. Click the icon for Quick Retrieve.',
+                    QSystemTrayIcon.MessageIcon.Information,
+                    3000
+                )
+            event.ignore()
+            return
+
         self.sound_manager.play_error()
         if len(self.smart_pass_man.passwords) > 0:
             reply = QMessageBox.question(
@@ -797,8 +1213,20 @@ class MainWindow(QMainWindow):
                 QMessageBox.No
             )
             if reply == QMessageBox.Yes:
+                self._shutdown()
                 event.accept()
             else:
                 event.ignore()
         else:
+            self._shutdown()
             event.accept()
+
+    def _shutdown(self):
+        self.cancel_derivations()
+        self.secret_cache.clear()
+        self.metadata_watcher.stop()
+        self.vaults.close()
+        if self.tray_icon is not None:
+            # Closing the last window no longer quits once tray mode was used.
+            self.tray_icon.hide()
+            QApplication.instance().quit()
@@ -12,5 +12,5 @@ class ExportImportDialogConfig(BaseConfig):
         self.import_text = (
                 "Import password metadata from a JSON file. "
                 "The file must contain valid password metadata in the same format as export. "
-                "Existing passwords with the same public keys will NOT be overwritten."
+                "You will see a preview of new, unchanged and conflicting entries before anything is saved."
             )
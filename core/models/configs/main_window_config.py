@@ -74,6 +74,7 @@ class MainWindowConfig(BaseConfig):
                 <p><b style="color: #2a82da">F1</b> - Show Help</p>
                 <p><b style="color: #2a82da">Ctrl + Q</b> - Exit Application</p>
                 <p><b style="color: #2a82da">Ctrl + P</b> - Create New Password</p>
+                <p><b style="color: #2a82da">Ctrl + R</b> - Quick Retrieve</p>
                 <p><b style="color: #2a82da">Ctrl + Shift + S</b> - Toggle Sounds</p>
                 <p><b style="color: #2a82da">Ctrl + /</b> - Keyboard shortcuts</p>
                 <p><b style="color: #2a82da">Ctrl + Shift + A</b> - About</p>
@@ -84,7 +85,8 @@ class MainWindowConfig(BaseConfig):
 
                 <h2 style="color: #2a82da">Password's Keyboard Shortcuts</h2>
 
-                <p><b style="color: #2a82da">Ctrl + G</b> - Get Password</p>
+                <p><b style="color: #2a82da">Ctrl + F</b> - Search Passwords</p>
+                <p><b style="color: #2a82da">Ctrl + G</b> - Get Password (all selected rows)</p>
                 <p><b style="color: #2a82da">Ctrl + Shift + E</b> - Edit Password</p>
                 <p><b style="color: #2a82da">Del</b> - Delete Password</p>
                 """
@@ -0,0 +1,19 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from PyQt5.QtCore import Qt, QSortFilterProxyModel
+
+
+class PasswordFilterProxyModel(QSortFilterProxyModel):
+    # Sorting and filtering are handed to the source model, which applies them
+    # to its list of public keys with precomputed collation keys and a set of
+    # matches. Overriding lessThan()/filterAcceptsRow() instead would cost one
+    # Python call per comparison or per row on every change.
+
+    def set_public_keys(self, public_keys):
+        source_model = self.sourceModel()
+        if source_model is not None:
+            source_model.set_filter(public_keys)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        source_model = self.sourceModel()
+        if source_model is not None:
+            source_model.sort_rows(column, order)
@@ -0,0 +1,385 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from itertools import compress
+
+from PyQt5.QtCore import Qt, QAbstractItemModel, QAbstractTableModel, QModelIndex, QTimer, pyqtSignal
+
+from core.utils.description_index import DescriptionIndex
+from core.utils.sort_keys import SortKeys
+
+
+class PasswordTableModel(QAbstractTableModel):
+    # Only the row order is kept here; descriptions and lengths are read from
+    # the manager on demand, so the view pays for visible rows only. The
+    # public key -> row index is built on the first lookup, not at load.
+    #
+    # Sorting and the description filter are applied here as well, to the
+    # list of public keys, so that the proxy in front of this model never has
+    # to call back into Python once per row. A filter that narrows the
+    # previous one removes the rows that no longer match instead of laying
+    # out the whole table again.
+
+    DESCRIPTION_COLUMN = 0
+    LENGTH_COLUMN = 1
+    GET_COLUMN = 2
+    EDIT_COLUMN = 3
+    DELETE_COLUMN = 4
+
+    PUBLIC_KEY_ROLE = Qt.UserRole + 1
+
+    # Above this many separate runs of rows, a narrowing filter relays out
+    # the table rather than removing each run.
+    max_removed_ranges = 16
+
+    # Emitted when entries hidden by the filter change, since dataChanged only
+    # covers visible rows; the owner re-runs the search that set the filter.
+    filter_outdated = pyqtSignal()
+
+    headers = ['Description', 'Length', 'Get', 'Edit', 'Delete']
+    action_texts = {GET_COLUMN: 'Get', EDIT_COLUMN: 'Edit', DELETE_COLUMN: 'Delete'}
+    action_tooltips = {
+        GET_COLUMN: 'Get Smart Password',
+        EDIT_COLUMN: 'Edit password description and length',
+        DELETE_COLUMN: 'Delete this password entry',
+    }
+
+    def __init__(self, smart_pass_man, parent=None):
+        super().__init__(parent)
+        self.smart_pass_man = smart_pass_man
+        self.description_index = DescriptionIndex(smart_pass_man)
+        self.sort_keys = SortKeys(smart_pass_man)
+        self._filter = None
+        self._public_keys = []
+        self._rows = None
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        self._order = list(smart_pass_man.passwords)
+        self._positions = None
+        self._wider = []
+        self._set_public_keys(self._order)
+
+    def _set_public_keys(self, public_keys):
+        self._public_keys = list(public_keys)
+        self._rows = None
+
+    def _row_index(self):
+        if self._rows is None:
+            self._rows = {public_key: row for row, public_key in enumerate(self._public_keys)}
+        return self._rows
+
+    def _set_order(self, public_keys):
+        self._order = public_keys
+        self._order_changed()
+
+    def _order_changed(self):
+        self._positions = None
+        self._wider = []
+
+    def _position_index(self):
+        if self._positions is None:
+            self._positions = {public_key: position for position, public_key in enumerate(self._order)}
+        return self._positions
+
+    def _reindex_from(self, first_row):
+        public_keys = self._public_keys
+        rows = self._rows
+        if rows is None:
+            return
+        for row in range(first_row, len(public_keys)):
+            rows[public_keys[row]] = row
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._public_keys)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        column = index.column()
+        public_key = self._public_keys[index.row()]
+        if role == self.PUBLIC_KEY_ROLE:
+            return public_key
+
+        smart_password = self.smart_pass_man.passwords.get(public_key)
+        if smart_password is None:
+            return None
+
+        if role == Qt.DisplayRole:
+            if column == self.DESCRIPTION_COLUMN:
+                return smart_password.description
+            if column == self.LENGTH_COLUMN:
+                return f"{smart_password.length} chars"
+            return self.action_texts.get(column)
+
+        if role == Qt.ToolTipRole:
+            if column == self.DESCRIPTION_COLUMN:
+                return smart_password.description
+            return self.action_tooltips.get(column)
+
+        if role == Qt.TextAlignmentRole and column == self.LENGTH_COLUMN:
+            return Qt.AlignmentFlag.AlignCenter
+
+        return None
+
+    def public_key_for_row(self, row):
+        if 0 <= row < len(self._public_keys):
+            return self._public_keys[row]
+        return None
+
+    def row_for_public_key(self, public_key):
+        return self._row_index().get(public_key, -1)
+
+    def reload(self):
+        self.beginResetModel()
+        self.description_index.invalidate()
+        self.sort_keys.invalidate()
+        self._set_order(self._sorted(self.smart_pass_man.passwords))
+        self._set_public_keys(self._filtered(self._order))
+        self.endResetModel()
+        QTimer.singleShot(0, self.description_index.start_build)
+
+    def set_manager(self, smart_pass_man):
+        # Switching vaults keeps the sort order; the filter is re-applied by
+        # the owner once the new entries can be searched.
+        self.smart_pass_man = smart_pass_man
+        self.description_index.set_manager(smart_pass_man)
+        self.sort_keys = SortKeys(smart_pass_man)
+        self._filter = None
+        self.reload()
+
+    def _sorted(self, public_keys):
+        if self._sort_column == self.DESCRIPTION_COLUMN:
+            public_keys = self.sort_keys.by_description(public_keys)
+        elif self._sort_column == self.LENGTH_COLUMN:
+            public_keys = self.sort_keys.by_length(public_keys)
+        else:
+            public_keys = list(self.smart_pass_man.passwords)
+        if self._sort_order == Qt.DescendingOrder and self._sort_column != -1:
+            public_keys.reverse()
+        return public_keys
+
+    def _filtered(self, public_keys):
+        if self._filter is None:
+            return public_keys
+        matches = self._filter
+        if len(matches) * 8 < len(public_keys) and public_keys is self._order:
+            # Few matches: order them instead of testing every entry.
+            positions = self._position_index()
+            return sorted((public_key for public_key in matches if public_key in positions), key=positions.__getitem__)
+        return list(filter(matches.__contains__, public_keys))
+
+    @property
+    def sort_column(self):
+        return self._sort_column
+
+    @property
+    def sort_order(self):
+        return self._sort_order
+
+    def is_sortable(self, column):
+        return column in (-1, self.DESCRIPTION_COLUMN, self.LENGTH_COLUMN)
+
+    def sort_rows(self, column, order=Qt.AscendingOrder):
+        if not self.is_sortable(column):
+            return False
+        if (column, order) != (self._sort_column, self._sort_order):
+            self._sort_column = column
+            self._sort_order = order
+            self._resort()
+        return True
+
+    def set_filter(self, public_keys):
+        # `_wider` keeps (filter, rows) for each filter the current one has
+        # narrowed, so deleting characters from the search text goes back to
+        # rows that were already worked out.
+        previous = self._filter
+        self._filter = public_keys
+        if public_keys is None:
+            self._wider = []
+            self._relayout(self._order)
+            return
+        if previous is not None and not public_keys <= previous:
+            while self._wider and not public_keys <= self._wider[-1][0]:
+                self._wider.pop()
+            if self._wider and len(public_keys) == len(self._wider[-1][0]):
+                self._relayout(self._wider.pop()[1])
+            else:
+                self._relayout(self._filtered(self._order))
+            return
+
+        # Narrowing: every row to keep is already shown, in order. Rows
+        # added since the last filter are shown whether they match or not,
+        # so only the row count tells whether anything has to go. The runs
+        # of rows to remove are found with bytes searches over one flag per
+        # row rather than a Python loop.
+        if len(public_keys) == len(self._public_keys):
+            return
+        if previous is not None and len(previous) == len(self._public_keys):
+            self._wider.append((previous, list(self._public_keys)))
+        kept = bytes(map(public_keys.__contains__, self._public_keys))
+        ranges = []
+        first_row = kept.find(0)
+        while first_row != -1 and len(ranges) <= self.max_removed_ranges:
+            next_row = kept.find(1, first_row)
+            if next_row == -1:
+                next_row = len(kept)
+            ranges.append((first_row, next_row - 1))
+            first_row = kept.find(0, next_row)
+
+        if len(ranges) > self.max_removed_ranges:
+            self._relayout(list(compress(self._public_keys, kept)))
+        else:
+            self._remove_ranges(ranges)
+
+    def _remove_ranges(self, ranges):
+        # Removing the last run first keeps the row numbers of the others valid.
+        for first_row, last_row in reversed(ranges):
+            self.beginRemoveRows(QModelIndex(), first_row, last_row)
+            del self._public_keys[first_row:last_row + 1]
+            self._rows = None
+            self.endRemoveRows()
+
+    def _resort(self):
+        self._set_order(self._sorted(self._order))
+        self._relayout(self._filtered(self._order))
+
+    def _relayout(self, public_keys):
+        if public_keys == self._public_keys:
+            return
+
+        self.layoutAboutToBeChanged.emit([], QAbstractItemModel.VerticalSortHint)
+        persistent = self.persistentIndexList()
+        moved_keys = [self._public_keys[index.row()] for index in persistent]
+        self._set_public_keys(public_keys)
+        moved = []
+        for public_key, index in zip(moved_keys, persistent):
+            row = self.row_for_public_key(public_key)
+            moved.append(self.index(row, index.column()) if row != -1 else QModelIndex())
+        self.changePersistentIndexList(persistent, moved)
+        self.layoutChanged.emit([], QAbstractItemModel.VerticalSortHint)
+
+    def _contains(self, public_key):
+        if public_key in self._row_index():
+            return True
+        return self._filter is not None and public_key in self._order
+
+    def add_password(self, smart_password):
+        if self._contains(smart_password.public_key):
+            self.update_password(smart_password.public_key)
+            return
+
+        rows = self._row_index()
+        row = len(self._public_keys)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._order.append(smart_password.public_key)
+        self._order_changed()
+        self._public_keys.append(smart_password.public_key)
+        rows[smart_password.public_key] = row
+        self.description_index.add(smart_password.public_key, smart_password.description)
+        self.sort_keys.add(smart_password.public_key, smart_password.description, smart_password.length)
+        self.endInsertRows()
+        if self._sort_column != -1:
+            self._resort()
+
+    def add_passwords(self, public_keys):
+        public_keys = [public_key for public_key in dict.fromkeys(public_keys) if not self._contains(public_key)]
+        if not public_keys:
+            return
+
+        first_row = len(self._public_keys)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(public_keys) - 1)
+        self._order.extend(public_keys)
+        self._order_changed()
+        self._public_keys.extend(public_keys)
+        self._reindex_from(first_row)
+        for public_key in public_keys:
+            smart_password = self.smart_pass_man.passwords[public_key]
+            self.description_index.add(public_key, smart_password.description)
+            self.sort_keys.add(public_key, smart_password.description, smart_password.length)
+        self.endInsertRows()
+        if self._sort_column != -1:
+            self._resort()
+
+    def update_password(self, public_key):
+        self.update_passwords([public_key])
+
+    def update_passwords(self, public_keys):
+        rows = []
+        listed = False
+        hidden = False
+        for public_key in public_keys:
+            smart_password = self.smart_pass_man.passwords.get(public_key)
+            if smart_password is not None:
+                self.description_index.add(public_key, smart_password.description)
+                self.sort_keys.add(public_key, smart_password.description, smart_password.length)
+            row = self.row_for_public_key(public_key)
+            if row != -1:
+                rows.append(row)
+            # Entries hidden by the filter still have to move in the order.
+            listed = listed or row != -1 or public_key in self._position_index()
+            hidden = hidden or (row == -1 and smart_password is not None)
+
+        for first_row, last_row in self._row_ranges(rows):
+            self.dataChanged.emit(
+                self.index(first_row, self.DESCRIPTION_COLUMN),
+                self.index(last_row, self.LENGTH_COLUMN)
+            )
+        if listed and self._sort_column != -1:
+            self._resort()
+        if hidden and self._filter is not None:
+            self.filter_outdated.emit()
+
+    @staticmethod
+    def _row_ranges(rows):
+        # Contiguous (first, last) runs of the given rows, in ascending order.
+        ranges = []
+        for row in sorted(set(rows)):
+            if ranges and ranges[-1][1] == row - 1:
+                ranges[-1][1] = row
+            else:
+                ranges.append([row, row])
+        return ranges
+
+    def remove_passwords(self, public_keys):
+        removed = {public_key for public_key in public_keys if self._contains(public_key)}
+        if not removed:
+            return
+
+        rows = [self.row_for_public_key(public_key) for public_key in removed]
+        self._remove_ranges(self._row_ranges([row for row in rows if row != -1]))
+
+        self._set_order([public_key for public_key in self._order if public_key not in removed])
+        for public_key in removed:
+            self.description_index.remove(public_key)
+            self.sort_keys.remove(public_key)
+
+    def remove_password(self, public_key):
+        row = self.row_for_public_key(public_key)
+        if row == -1:
+            if self._filter is not None and public_key in self._order:
+                self._order.remove(public_key)
+                self._order_changed()
+                self.description_index.remove(public_key)
+                self.sort_keys.remove(public_key)
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._order.remove(public_key)
+        self._order_changed()
+        del self._public_keys[row]
+        del self._rows[public_key]
+        self._reindex_from(row)
+        self.description_index.remove(public_key)
+        self.sort_keys.remove(public_key)
+        self.endRemoveRows()
@@ -0,0 +1,16 @@
+
+
+class BatchGetDialogStyles:
+    submit_button_style = "background-color: #2a82da; color: white;"
+    results_table_style = """
+            QTableWidget {
+                font-family: monospace;
+                background-color: #2a2a2a;
+                border: 1px solid #444;
+                border-radius: 4px;
+            }
+        """
+    status_style = "color: #888;"
+    copy_button_style = "background-color: #2e7d32; color: white;"
+    pending_color = "#888888"
+    matched_color = "#4caf50"
@@ -0,0 +1,7 @@
+
+
+class ImportPreviewDialogStyles:
+    import_button_style = "background-color: #ff9800; color: white;"
+    note_style = "color: #888;"
+    invalid_style = "font-family: monospace; color: #da2a2a;"
+    changed_color = "#ff9800"
@@ -5,8 +5,8 @@ class MainWindowStyles:
     count_label_style = "color: #888;"
     line_style = "color: #444;"
     copyright_label_style = "color: #888; font-size: 16px;"
-    table_widget_style = """
-            QTableWidget {
+    table_view_style = """
+            QTableView {
                 background-color: #2a2a2a;
                 gridline-color: #444;
             }
@@ -67,40 +67,6 @@ class MainWindowStyles:
                 background-color: #1a72ca;
             }
         """
-    get_button_style = """
-            QPushButton {
-                background-color: #2a82da;
-                color: white;
-                border-radius: 3px;
-                padding: 5px 10px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #1a72ca;
-            }
-        """
-    edit_button_style = """
-            QPushButton {
-                background-color: #ff9800;
-                color: white;
-                border-radius: 3px;
-                padding: 5px 10px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #e68900;
-            }
-        """
-    delete_button_style = """
-            QPushButton {
-                background-color: #da2a2a;
-                color: white;
-                border-radius: 3px;
-                padding: 5px;
-                min-width: 60px;
-                max-width: 60px;
-            }
-            QPushButton:hover {
-                background-color: #ca1a1a;
-            }
-        """
+    get_button_color = "#2a82da"
+    edit_button_color = "#ff9800"
+    delete_button_color = "#da2a2a"
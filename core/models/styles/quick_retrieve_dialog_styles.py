@@ -0,0 +1,16 @@
+
+
+class QuickRetrieveDialogStyles:
+    search_input_style = "font-size: 14px; padding: 6px;"
+    matches_list_style = """
+            QListWidget {
+                background-color: #2a2a2a;
+                border: 1px solid #444;
+                border-radius: 4px;
+            }
+            QListWidget::item {
+                padding: 4px;
+            }
+        """
+    status_style = "color: #888;"
+    error_style = "color: #da2a2a;"
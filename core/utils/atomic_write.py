@@ -0,0 +1,24 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import os
+import tempfile
+from pathlib import Path
+
+
+def atomic_write(filename, writer, mode='w', buffering=-1):
+    # `writer(f)` fills a temporary file next to `filename`, which is synced
+    # and renamed over it, so readers only ever see a complete file. Errors
+    # are re-raised after the temporary file is removed.
+    path = Path(filename)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode, buffering=buffering) as f:
+            writer(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
@@ -0,0 +1,328 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import mmap
+import os
+import struct
+import warnings
+from collections.abc import MutableMapping
+from pathlib import Path
+
+from smartpasslib import SmartPasswordManager, SmartPassword
+
+from core.utils.atomic_write import atomic_write
+from core.utils.metadata_batch import write_metadata
+
+# Layout: header | records (one per entry, file order) | index (record numbers
+# sorted by public key) | UTF-8 string table with the descriptions.
+MAGIC = b'SPMB'
+VERSION = 1
+HEADER = struct.Struct('<4sHxxI')
+RECORD = struct.Struct('<32sHxxII')
+INDEX = struct.Struct('<I')
+KEY_SIZE = 32
+
+STORE_SUFFIX = '.bin'
+
+
+def default_store_path():
+    return str(Path.home() / '.config' / 'smart_password_manager' / f'passwords{STORE_SUFFIX}')
+
+
+def default_metadata_path():
+    return str(Path.home() / '.config' / 'smart_password_manager' / 'passwords.json')
+
+
+def is_store_path(filename):
+    return str(filename).endswith(STORE_SUFFIX)
+
+
+def _pack_public_key(public_key):
+    try:
+        packed = bytes.fromhex(public_key)
+    except (TypeError, ValueError):
+        packed = b''
+    if len(packed) != KEY_SIZE:
+        raise ValueError(f'Public key is not a 64-digit hex string: {public_key!r}')
+    return packed
+
+
+def validate_record(public_key, length):
+    # Why an entry cannot be stored in the binary format, or None. Entries are
+    # checked when they are added, so that a later save cannot fail on them.
+    try:
+        _pack_public_key(public_key)
+    except ValueError:
+        return 'public_key is not a 64-digit hex string'
+    try:
+        RECORD.pack(bytes(KEY_SIZE), length, 0, 0)
+    except struct.error:
+        return 'length is out of range'
+    return None
+
+
+class BinaryStore:
+    # Read-only view of a store file. Records are decoded on demand, so opening
+    # a store costs the same for ten entries as for a hundred thousand.
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        if len(buffer) < HEADER.size:
+            raise ValueError('File is too short to be a password store')
+        magic, version, self.count = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('Not a password store or unsupported store version')
+        self._records_offset = HEADER.size
+        self._index_offset = self._records_offset + self.count * RECORD.size
+        self._strings_offset = self._index_offset + self.count * INDEX.size
+        if len(buffer) < self._strings_offset:
+            raise ValueError('Password store is truncated')
+        self._public_keys = None
+
+    @classmethod
+    def open(cls, filename):
+        with open(filename, 'rb') as f:
+            if os.name == 'nt':
+                # A mapped file cannot be replaced on Windows, which would
+                # block every later atomic save.
+                return cls(f.read())
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError('File is too short to be a password store')
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self):
+        return self.count
+
+    def _packed_key(self, row):
+        offset = self._records_offset + row * RECORD.size
+        return self._buffer[offset:offset + KEY_SIZE]
+
+    def public_key(self, row):
+        return self._packed_key(row).hex()
+
+    def public_keys(self):
+        # One hex() over the whole record block is far cheaper than one per
+        # record; the keys are then sliced out of the hex string.
+        if self._public_keys is None:
+            block = self._buffer[self._records_offset:self._index_offset].hex()
+            step = RECORD.size * 2
+            self._public_keys = [block[start:start + KEY_SIZE * 2] for start in range(0, len(block), step)]
+        return self._public_keys
+
+    def record(self, row):
+        packed_key, length, description_offset, description_size = RECORD.unpack_from(
+            self._buffer, self._records_offset + row * RECORD.size
+        )
+        start = self._strings_offset + description_offset
+        description = bytes(self._buffer[start:start + description_size]).decode('utf-8')
+        return packed_key.hex(), description, length
+
+    def find(self, public_key):
+        try:
+            packed_key = _pack_public_key(public_key)
+        except ValueError:
+            return -1
+
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            row = INDEX.unpack_from(self._buffer, self._index_offset + middle * INDEX.size)[0]
+            candidate = self._packed_key(row)
+            if candidate == packed_key:
+                return row
+            if candidate < packed_key:
+                low = middle + 1
+            else:
+                high = middle
+        return -1
+
+
+class BinaryPasswordMap(MutableMapping):
+    # Dict-like password collection over a BinaryStore. Entries become
+    # SmartPassword objects only when accessed; changes are kept in memory
+    # until the next save rewrites the store.
+
+    def __init__(self, store=None):
+        self._store = store
+        self._entries = {}
+        self._added = {}
+        self._deleted = set()
+
+    def _find(self, public_key):
+        if self._store is None or public_key in self._deleted:
+            return -1
+        return self._store.find(public_key)
+
+    def __getitem__(self, public_key):
+        smart_password = self._entries.get(public_key)
+        if smart_password is not None:
+            return smart_password
+
+        row = self._find(public_key)
+        if row < 0:
+            raise KeyError(public_key)
+        _, description, length = self._store.record(row)
+        smart_password = SmartPassword(public_key=public_key, description=description, length=length)
+        self._entries[public_key] = smart_password
+        return smart_password
+
+    def __setitem__(self, public_key, smart_password):
+        error = validate_record(public_key, smart_password.length)
+        if error is not None:
+            raise ValueError(f'Cannot store {public_key!r}: {error}')
+        self._entries[public_key] = smart_password
+        if self._store is None or self._store.find(public_key) < 0:
+            self._added[public_key] = None
+        self._deleted.discard(public_key)
+
+    def __delitem__(self, public_key):
+        if public_key not in self:
+            raise KeyError(public_key)
+        self._entries.pop(public_key, None)
+        if public_key in self._added:
+            del self._added[public_key]
+        else:
+            self._deleted.add(public_key)
+
+    def __contains__(self, public_key):
+        return public_key in self._entries or self._find(public_key) >= 0
+
+    def __iter__(self):
+        if self._store is not None:
+            deleted = self._deleted
+            if deleted:
+                yield from (public_key for public_key in self._store.public_keys() if public_key not in deleted)
+            else:
+                yield from self._store.public_keys()
+        yield from list(self._added)
+
+    def __len__(self):
+        stored = len(self._store) if self._store is not None else 0
+        return stored - len(self._deleted) + len(self._added)
+
+    def records(self):
+        # (public_key, description, length) for every entry, without building
+        # SmartPassword objects for entries nobody has touched.
+        if self._store is not None:
+            for row, public_key in enumerate(self._store.public_keys()):
+                if public_key in self._deleted:
+                    continue
+                smart_password = self._entries.get(public_key)
+                if smart_password is None:
+                    yield self._store.record(row)
+                else:
+                    yield public_key, smart_password.description, smart_password.length
+        for public_key in self._added:
+            smart_password = self._entries.get(public_key)
+            if smart_password is not None:
+                yield public_key, smart_password.description, smart_password.length
+
+    def snapshot(self):
+        # Each copy is atomic under the GIL; copying _added before _entries
+        # means every added key is also present in the copied entries.
+        copy = BinaryPasswordMap(self._store)
+        copy._added = dict(self._added)
+        copy._deleted = set(self._deleted)
+        copy._entries = dict(self._entries)
+        return copy
+
+
+def iter_records(passwords):
+    if isinstance(passwords, BinaryPasswordMap):
+        return passwords.records()
+    return ((public_key, sp.description, sp.length) for public_key, sp in passwords.items())
+
+
+def record_map(passwords):
+    return {public_key: (description, length) for public_key, description, length in iter_records(passwords)}
+
+
+def write_binary_store(filename, passwords):
+    records = bytearray()
+    strings = bytearray()
+    keys = []
+    try:
+        for public_key, description, length in iter_records(passwords):
+            packed_key = _pack_public_key(public_key)
+            encoded = description.encode('utf-8')
+            records += RECORD.pack(packed_key, length, len(strings), len(encoded))
+            strings += encoded
+            keys.append(packed_key)
+    except (ValueError, struct.error) as e:
+        warnings.warn(f"Failed to save passwords to {filename}: {e}")
+        return False
+
+    index = b''.join(INDEX.pack(row) for row in sorted(range(len(keys)), key=keys.__getitem__))
+
+    def write(f):
+        f.write(HEADER.pack(MAGIC, VERSION, len(keys)))
+        f.write(records)
+        f.write(index)
+        f.write(strings)
+
+    try:
+        atomic_write(filename, write, 'wb')
+    except OSError as e:
+        warnings.warn(f"Failed to save passwords to {filename}: {e}")
+        return False
+    return True
+
+
+def snapshot_passwords(passwords):
+    if isinstance(passwords, BinaryPasswordMap):
+        return passwords.snapshot()
+    return dict(passwords)
+
+
+def write_passwords(filename, passwords):
+    if is_store_path(filename):
+        return write_binary_store(filename, passwords)
+    return write_metadata(filename, passwords)
+
+
+class BinarySmartPasswordManager(SmartPasswordManager):
+
+    def _load_data(self):
+        if not os.path.isfile(self.filename):
+            return BinaryPasswordMap()
+        try:
+            return BinaryPasswordMap(BinaryStore.open(self.filename))
+        except (OSError, ValueError) as e:
+            warnings.warn(f"Failed to load passwords from {self.filename}: {e}")
+            return BinaryPasswordMap()
+
+    def _write_data(self):
+        write_binary_store(self.filename, self.smart_passwords)
+
+
+def open_password_manager(filename=None):
+    if filename is None:
+        store_path = default_store_path()
+        if os.path.isfile(store_path):
+            return BinarySmartPasswordManager(store_path)
+        return SmartPasswordManager()
+    if is_store_path(filename):
+        return BinarySmartPasswordManager(filename)
+    return SmartPasswordManager(filename)
+
+
+def convert_to_binary_store(smart_pass_man, filename=None):
+    filename = filename or default_store_path()
+    for public_key, description, length in iter_records(smart_pass_man.passwords):
+        error = validate_record(public_key, length)
+        if error is not None:
+            raise ValueError(f'Cannot store {public_key!r}: {error}')
+    write_binary_store(filename, snapshot_passwords(smart_pass_man.passwords))
+    json_filename = smart_pass_man.filename
+    smart_pass_man.filename = filename
+    if os.path.isfile(json_filename) and not is_store_path(json_filename):
+        os.replace(json_filename, json_filename + '.bak')
+    return filename
+
+
+def convert_to_json(smart_pass_man, filename=None):
+    filename = filename or default_metadata_path()
+    write_metadata(filename, snapshot_passwords(smart_pass_man.passwords))
+    store_filename = smart_pass_man.filename
+    smart_pass_man.filename = filename
+    if is_store_path(store_filename) and os.path.isfile(store_filename):
+        os.unlink(store_filename)
+    return filename
@@ -0,0 +1,40 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class DerivationSignals(QObject):
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class DerivationWorker(QRunnable):
+
+    def __init__(self, func, *args, **kwargs):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = DerivationSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def run(self):
+        # Cancelled workers still report, so that owners keeping them until
+        # then can let them go; owners ignore what cancelled workers return.
+        if self._cancelled:
+            self.signals.failed.emit('Cancelled')
+            return
+
+        try:
+            result = self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+
+        self.signals.finished.emit(result)
@@ -0,0 +1,235 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import heapq
+from bisect import bisect_left
+
+from PyQt5.QtCore import QThreadPool
+
+from core.utils.binary_store import iter_records, snapshot_passwords
+from core.utils.derivation_worker import DerivationWorker
+
+# Sorts after every character, so `prefix + PREFIX_END` bounds the strings
+# that start with `prefix`.
+PREFIX_END = '\U0010ffff'
+
+
+def iter_trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def build_tables(passwords):
+    # (descriptions, trigrams, prefixes, prefix_keys) for DescriptionIndex.
+    # Safe to run on the thread pool over a snapshot_passwords() copy.
+    descriptions = {}
+    trigrams = {}
+    for public_key, description, _ in iter_records(passwords):
+        folded = description.casefold()
+        descriptions[public_key] = folded
+        for trigram in iter_trigrams(folded):
+            trigrams.setdefault(trigram, set()).add(public_key)
+    prefix_keys = sorted(descriptions, key=descriptions.__getitem__)
+    prefixes = [descriptions[public_key] for public_key in prefix_keys]
+    return descriptions, trigrams, prefixes, prefix_keys
+
+
+class DescriptionIndex:
+    # Case-folded index over password descriptions. Queries of three or more
+    # characters match anywhere in a description through trigram sets; shorter
+    # ones, which would match most entries anywhere, match the start of a
+    # description through a sorted list.
+    #
+    # start_build() builds the index on the thread pool, so neither startup
+    # nor the first keystroke pays for it; edits made meanwhile are replayed
+    # once it is done. Searches in the meantime scan the entries directly.
+
+    def __init__(self, smart_pass_man):
+        self.smart_pass_man = smart_pass_man
+        self._descriptions = {}
+        self._trigrams = {}
+        self._prefixes = []
+        self._prefix_keys = []
+        self._built = False
+        # (query, matches) for the trigram searches typed so far; matches
+        # are a set of public keys, or a dict of them to their descriptions.
+        self._history = []
+        self._worker = None
+        # Superseded builds stay referenced until they report, like the
+        # metadata watcher's workers.
+        self._retired = set()
+        self._changes = {}
+
+    def set_manager(self, smart_pass_man):
+        self.smart_pass_man = smart_pass_man
+        self.invalidate()
+
+    def invalidate(self):
+        self._retire_worker()
+        self._descriptions = {}
+        self._trigrams = {}
+        self._prefixes = []
+        self._prefix_keys = []
+        self._built = False
+        self._history = []
+
+    def _retire_worker(self):
+        if self._worker is not None:
+            self._retired.add(self._worker)
+            self._worker = None
+        self._changes = {}
+
+    def _install(self, tables):
+        self._descriptions, self._trigrams, self._prefixes, self._prefix_keys = tables
+        self._built = True
+        self._history = []
+
+    def start_build(self):
+        if self._built or self._worker is not None:
+            return
+        worker = DerivationWorker(build_tables, snapshot_passwords(self.smart_pass_man.passwords))
+        worker.signals.finished.connect(lambda tables: self._on_built(worker, tables))
+        worker.signals.failed.connect(lambda error: self._on_built(worker, None))
+        self._worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_built(self, worker, tables):
+        if worker is not self._worker:
+            self._retired.discard(worker)
+            return
+        self._worker = None
+        changes = self._changes
+        self._changes = {}
+        # A failed build is retried synchronously by the next search.
+        if tables is None:
+            return
+
+        self._install(tables)
+        for public_key, description in changes.items():
+            self._remove(public_key)
+            if description is not None:
+                self._add(public_key, description)
+
+    def ensure_built(self):
+        if self._built:
+            return
+        self._retire_worker()
+        self._install(build_tables(self.smart_pass_man.passwords))
+
+    def _add(self, public_key, description):
+        folded = description.casefold()
+        self._descriptions[public_key] = folded
+        for trigram in iter_trigrams(folded):
+            self._trigrams.setdefault(trigram, set()).add(public_key)
+        position = bisect_left(self._prefixes, folded)
+        self._prefixes.insert(position, folded)
+        self._prefix_keys.insert(position, public_key)
+
+    def _remove(self, public_key):
+        folded = self._descriptions.pop(public_key, None)
+        if folded is None:
+            return
+        for trigram in iter_trigrams(folded):
+            public_keys = self._trigrams.get(trigram)
+            if public_keys is not None:
+                public_keys.discard(public_key)
+                if not public_keys:
+                    del self._trigrams[trigram]
+        position = bisect_left(self._prefixes, folded)
+        while self._prefix_keys[position] != public_key:
+            position += 1
+        del self._prefixes[position]
+        del self._prefix_keys[position]
+
+    def add(self, public_key, description):
+        if self._built:
+            self._remove(public_key)
+            self._add(public_key, description)
+        elif self._worker is not None:
+            self._changes[public_key] = description
+        self._history = []
+
+    def remove(self, public_key):
+        if self._built:
+            self._remove(public_key)
+        elif self._worker is not None:
+            self._changes[public_key] = None
+        self._history = []
+
+    @staticmethod
+    def _matches(query, folded):
+        return folded.startswith(query) if len(query) < 3 else query in folded
+
+    def _scan(self, query):
+        # Used only while the index is being built.
+        return {
+            public_key
+            for public_key, description, _ in iter_records(self.smart_pass_man.passwords)
+            if self._matches(query, description.casefold())
+        }
+
+    def search(self, query):
+        # Returns a new set, which callers may keep.
+        query = query.strip().casefold()
+        if not query:
+            return None
+
+        if not self._built:
+            if self._worker is not None:
+                return self._scan(query)
+            self.ensure_built()
+
+        if len(query) < 3:
+            start = bisect_left(self._prefixes, query)
+            end = bisect_left(self._prefixes, query + PREFIX_END, start)
+            return set(self._prefix_keys[start:end])
+
+        # Each query in `_history` extends the one before it, so its matches
+        # are a subset of theirs: typing on only checks the last matches,
+        # and deleting characters goes back to earlier ones.
+        history = self._history
+        while history and history[-1][0] not in query:
+            history.pop()
+        if history and history[-1][0] == query:
+            return set(history[-1][1])
+
+        if history:
+            candidates = history[-1][1]
+        else:
+            trigram_sets = sorted(
+                (self._trigrams.get(trigram, set()) for trigram in iter_trigrams(query)),
+                key=len
+            )
+            candidates = trigram_sets[0].intersection(*trigram_sets[1:])
+
+        descriptions = self._descriptions
+        if not history and len(query) == 3:
+            # A trigram set holds exactly the descriptions containing it.
+            result = candidates
+        elif isinstance(candidates, dict):
+            result = {public_key: folded for public_key, folded in candidates.items() if query in folded}
+        else:
+            # Checked matches keep their descriptions, so that the next,
+            # longer query does not have to look them up again.
+            result = {
+                public_key: descriptions[public_key]
+                for public_key in candidates if query in descriptions[public_key]
+            }
+
+        history.append((query, result))
+        return set(result)
+
+    def best_matches(self, query, limit=10):
+        # Descriptions starting with the query rank first, then the other
+        # matches; both alphabetically. Only `limit` entries are ordered.
+        result = self.search(query)
+        if not result:
+            return []
+        query = query.strip().casefold()
+        if self._built:
+            folded = self._descriptions.__getitem__
+        else:
+            passwords = self.smart_pass_man.passwords
+            folded = lambda public_key: passwords[public_key].description.casefold()
+        return heapq.nsmallest(
+            limit,
+            result,
+            key=lambda public_key: (not folded(public_key).startswith(query), folded(public_key))
+        )
@@ -0,0 +1,73 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from core.utils.atomic_write import atomic_write
+from core.utils.binary_store import iter_records
+from core.utils.json_stream import iter_object_chunks
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+class ExportSignals(QObject):
+
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(int)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+
+class ExportWorker(QRunnable):
+
+    progress_interval = 1000
+    buffer_size = 1024 * 1024
+
+    # `passwords` should be a snapshot_passwords() copy. Entries are read as
+    # plain records, so a binary store is exported without building a
+    # SmartPassword per entry.
+    def __init__(self, filename, passwords, metadata=None, indent=None, separators=None):
+        super().__init__()
+        self.filename = filename
+        self.passwords = passwords
+        self.metadata = metadata
+        self.indent = indent
+        self.separators = separators
+        self.signals = ExportSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def _iter_items(self):
+        if self.metadata is not None:
+            yield "_metadata", self.metadata
+
+        total = len(self.passwords)
+        for written, (public_key, description, length) in enumerate(iter_records(self.passwords), 1):
+            yield public_key, {"public_key": public_key, "description": description, "length": length}
+            if written % self.progress_interval == 0 or written == total:
+                self.signals.progress.emit(written, total)
+            if self._cancelled:
+                return
+
+    def _write(self, f):
+        for chunk in iter_object_chunks(self._iter_items(), self.indent, self.separators):
+            if self._cancelled:
+                break
+            f.write(chunk)
+        # Raising leaves the previous file in place.
+        if self._cancelled:
+            raise ExportCancelled()
+
+    def run(self):
+        try:
+            atomic_write(self.filename, self._write, buffering=self.buffer_size)
+            self.signals.finished.emit(len(self.passwords))
+        except ExportCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
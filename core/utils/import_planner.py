@@ -0,0 +1,104 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from smartpasslib import SmartPassword
+
+from core.utils.binary_store import BinaryPasswordMap, validate_record
+
+
+class ImportConflict:
+    # The current values are copied rather than referenced: committing an
+    # overwrite updates the existing SmartPassword in place.
+    __slots__ = ('public_key', 'current_description', 'current_length', 'description', 'length')
+
+    def __init__(self, public_key, current_description, current_length, description, length):
+        self.public_key = public_key
+        self.current_description = current_description
+        self.current_length = current_length
+        self.description = description
+        self.length = length
+
+
+class ImportPlan:
+
+    def __init__(self, new, duplicates, conflicts, invalid, repeated):
+        self.new = new
+        self.duplicates = duplicates
+        self.conflicts = conflicts
+        self.invalid = invalid
+        self.repeated = repeated
+
+    @property
+    def skipped(self):
+        return len(self.duplicates) + len(self.invalid) + self.repeated
+
+
+class ImportPlanner:
+    # Collects validated entries chunk by chunk, then classifies all of them
+    # against the existing metadata with set operations in finish().
+
+    def __init__(self, passwords):
+        self.passwords = passwords
+        self._incoming = {}
+        self._invalid = []
+        self._repeated = 0
+        # The binary store only holds hex keys and 16-bit lengths.
+        self._binary = isinstance(passwords, BinaryPasswordMap)
+
+    @staticmethod
+    def validate(key, data):
+        if not isinstance(data, dict):
+            return 'entry is not an object'
+        public_key = data.get('public_key')
+        if not isinstance(public_key, str) or not public_key:
+            return 'missing public_key'
+        if not isinstance(data.get('description'), str):
+            return 'description is not text'
+        length = data.get('length')
+        if isinstance(length, bool) or not isinstance(length, int) or length < 1:
+            return 'length is not a positive integer'
+        return None
+
+    def add_chunk(self, items):
+        incoming = self._incoming
+        for key, data in items:
+            if key == "_metadata":
+                continue
+
+            error = self.validate(key, data)
+            if error is None and self._binary:
+                error = validate_record(data['public_key'], data['length'])
+            if error is not None:
+                self._invalid.append((key, error))
+                continue
+
+            public_key = data['public_key']
+            if public_key in incoming:
+                self._repeated += 1
+                continue
+            incoming[public_key] = (data['description'], data['length'])
+
+    def finish(self):
+        incoming = self._incoming
+        passwords = self.passwords
+        existing_keys = passwords.keys() if isinstance(passwords, dict) else {
+            public_key for public_key in incoming if public_key in passwords
+        }
+        common = incoming.keys() & existing_keys
+
+        duplicates = []
+        conflicts = []
+        for public_key in common:
+            description, length = incoming[public_key]
+            current = passwords[public_key]
+            if current.description == description and current.length == length:
+                duplicates.append(public_key)
+            else:
+                conflicts.append(
+                    ImportConflict(public_key, current.description, current.length, description, length)
+                )
+
+        new = [
+            SmartPassword(public_key=public_key, description=description, length=length)
+            for public_key, (description, length) in incoming.items()
+            if public_key not in common
+        ]
+        return ImportPlan(new, duplicates, conflicts, self._invalid, self._repeated)
@@ -0,0 +1,104 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import codecs
+import json
+
+WHITESPACE = ' \t\n\r'
+NUMBER_CHARS = '0123456789.eE+-'
+
+
+def iter_object_items(fp, chunk_size=64 * 1024):
+    # Yields (key, value) pairs of the top-level JSON object in a binary file,
+    # reading chunk_size bytes at a time so only the current entry is held in
+    # memory; fp.tell() can be polled between items for progress. Malformed
+    # input, including data after the object, raises json.JSONDecodeError.
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8-sig')()
+    buffer = ''
+    position = 0
+    eof = False
+
+    def read_more():
+        nonlocal buffer, position, eof
+        if eof:
+            return False
+        data = fp.read(chunk_size)
+        eof = not data
+        buffer = buffer[position:] + utf8.decode(data, final=eof)
+        position = 0
+        return True
+
+    def next_char():
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in WHITESPACE:
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not read_more():
+                return ''
+
+    def expect(chars):
+        nonlocal position
+        char = next_char()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", buffer, position)
+        position += 1
+        return char
+
+    def decode_value():
+        nonlocal position
+        next_char()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if not read_more():
+                    raise
+                continue
+            # A number that ends at the buffer edge, or before '.', 'e' and the like, may be truncated.
+            if (end == len(buffer) or buffer[end] in NUMBER_CHARS) and read_more():
+                continue
+            position = end
+            return value
+
+    expect('{')
+    if next_char() == '}':
+        position += 1
+    else:
+        while True:
+            if next_char() != '"':
+                raise json.JSONDecodeError("Expecting property name enclosed in double quotes", buffer, position)
+            key = decode_value()
+            expect(':')
+            yield key, decode_value()
+            if expect(',}') == '}':
+                break
+
+    if next_char():
+        raise json.JSONDecodeError("Extra data", buffer, position)
+
+
+def iter_object_chunks(items, indent=None, separators=None):
+    # Yields the text of a JSON object built from (key, value) pairs, one entry
+    # at a time. The chunks join to exactly json.dumps(dict(items), indent=indent,
+    # separators=separators) without holding the whole object in memory.
+    if separators is None:
+        separators = (',', ': ') if indent is not None else (', ', ': ')
+    item_separator, key_separator = separators
+
+    if indent is None:
+        open_entry = ''
+        close_object = '}'
+    else:
+        open_entry = '\n' + ' ' * indent
+        close_object = '\n}'
+
+    yield '{'
+    first = True
+    for key, value in items:
+        text = json.dumps(value, indent=indent, separators=separators)
+        if indent is not None:
+            text = text.replace('\n', open_entry)
+        yield f"{'' if first else item_separator}{open_entry}{json.dumps(key)}{key_separator}{text}"
+        first = False
+    yield '}' if first else close_object
@@ -0,0 +1,67 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+import warnings
+
+from core.utils.atomic_write import atomic_write
+
+
+def write_metadata(filename, smart_passwords):
+    data = {public_key: sp.to_dict() for public_key, sp in smart_passwords.items()}
+    try:
+        atomic_write(filename, lambda f: json.dump(data, f, indent=4))
+    except OSError as e:
+        warnings.warn(f"Failed to save passwords to {filename}: {e}")
+        return False
+    return True
+
+
+class MetadataBatch:
+    # Defers SmartPasswordManager persistence until the batch exits, then
+    # flushes once through whatever writer was installed before it.
+
+    def __init__(self, smart_pass_man):
+        self.smart_pass_man = smart_pass_man
+        self.write_count = 0
+        self._write_data = None
+        self._had_own_writer = False
+
+    def __enter__(self):
+        self._had_own_writer = '_write_data' in vars(self.smart_pass_man)
+        self._write_data = self.smart_pass_man._write_data
+        self.smart_pass_man._write_data = self._defer_write
+        self.write_count = 0
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._had_own_writer:
+            self.smart_pass_man._write_data = self._write_data
+        else:
+            del self.smart_pass_man._write_data
+
+        # Nothing is flushed when the batch body raises; callers roll back their
+        # in-memory changes and the next successful write persists the rest.
+        if exc_type is None and self.write_count:
+            self._write_data()
+        return False
+
+    def _defer_write(self):
+        self.write_count += 1
+
+    def discard_pending(self):
+        self.write_count = 0
+
+    def add_smart_passwords(self, smart_passwords):
+        added_public_keys = []
+        for smart_password in smart_passwords:
+            if smart_password.public_key in self.smart_pass_man.passwords:
+                continue
+            self.smart_pass_man.add_smart_password(smart_password)
+            added_public_keys.append(smart_password.public_key)
+        return added_public_keys
+
+    def update_smart_passwords(self, updates):
+        updated_public_keys = []
+        for public_key, description, length in updates:
+            if self.smart_pass_man.update_smart_password(public_key, description=description, length=length):
+                updated_public_keys.append(public_key)
+        return updated_public_keys
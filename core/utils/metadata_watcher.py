@@ -0,0 +1,293 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+import os
+from pathlib import Path
+
+from PyQt5.QtCore import QFileSystemWatcher, QObject, QThreadPool, QTimer, pyqtSignal
+from smartpasslib import SmartPassword
+
+from core.utils.binary_store import BinaryPasswordMap, BinaryStore, is_store_path, record_map, snapshot_passwords
+from core.utils.derivation_worker import DerivationWorker
+from core.utils.import_planner import ImportPlanner
+from core.utils.metadata_batch import MetadataBatch
+
+
+def file_signature(filename):
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def read_records(filename):
+    # public_key -> (description, length) for every valid entry in the file.
+    if is_store_path(filename):
+        return {
+            public_key: (description, length)
+            for public_key, description, length in BinaryPasswordMap(BinaryStore.open(filename)).records()
+        }
+
+    with open(filename, 'r') as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError('Metadata file does not contain a JSON object')
+    return {
+        entry['public_key']: (entry['description'], entry['length'])
+        for key, entry in data.items()
+        if ImportPlanner.validate(key, entry) is None
+    }
+
+
+class MetadataDiff:
+    # `updated` holds (public_key, previous, current) and `removed` holds
+    # (public_key, previous), with (description, length) values. Applying a
+    # change requires the entry to still match `previous`.
+
+    def __init__(self, added, updated, removed):
+        self.added = added
+        self.updated = updated
+        self.removed = removed
+
+    def __bool__(self):
+        return bool(self.added or self.updated or self.removed)
+
+
+def read_synced_records(filename, signature):
+    # The file's records, or None if it no longer has `signature`.
+    records = read_records(filename)
+    return records if file_signature(filename) == signature else None
+
+
+def diff_records(base, filename):
+    # `base` holds the records the manager last synced with. Returns the
+    # changes since then together with the records now in the file.
+    records = read_records(filename)
+
+    added = [
+        SmartPassword(public_key=public_key, description=description, length=length)
+        for public_key, (description, length) in records.items()
+        if public_key not in base
+    ]
+    updated = [
+        (public_key, previous, records[public_key])
+        for public_key, previous in base.items()
+        if public_key in records and records[public_key] != previous
+    ]
+    removed = [
+        (public_key, previous)
+        for public_key, previous in base.items()
+        if public_key not in records
+    ]
+    return MetadataDiff(added, updated, removed), records
+
+
+class MetadataWatcher(QObject):
+    # Reloads the metadata file when another process changes it. Events are
+    # debounced, the file is parsed and diffed on the thread pool, and only
+    # the entries that differ are applied to the manager.
+    #
+    # Our own saves are recognised by the file signature the writer reports
+    # after each write. Changes are diffed against the records of the last
+    # load, save or reload rather than against the manager, so entries with
+    # local edits still waiting to be saved keep them while the rest of the
+    # file is merged.
+
+    changed = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    _own_written = pyqtSignal(object, object)
+
+    def __init__(self, smart_pass_man, writer=None, delay=300, parent=None):
+        super().__init__(parent)
+        self.smart_pass_man = smart_pass_man
+        self.writer = writer
+        self._filename = None
+        self._signature = None
+        self._own_signature = None
+        self._records = None
+        self._worker = None
+        # Superseded workers stay referenced until their result arrives and is
+        # ignored: a result may already be queued, and collecting the worker
+        # would free the slot it is queued for.
+        self._retired = set()
+        self._own_written.connect(self._on_own_write)
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._schedule)
+        self._watcher.directoryChanged.connect(self._schedule)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self.reload)
+
+        if writer is not None:
+            writer.on_written = self.note_own_write
+        self.watch()
+
+    def watch(self, signature=None):
+        # `signature` is the file state the manager was loaded from; if the
+        # file has changed since, the difference is reloaded right away.
+        paths = self._watcher.files() + self._watcher.directories()
+        if paths:
+            self._watcher.removePaths(paths)
+
+        self._filename = str(self.smart_pass_man.filename)
+        directory = Path(self._filename).parent
+        directory.mkdir(parents=True, exist_ok=True)
+        # Atomic saves replace the file, which drops a watch on the file
+        # itself; the directory watch notices the new one.
+        self._watcher.addPath(str(directory))
+        self._watch_file()
+        self._signature = file_signature(self._filename)
+        self._records = None
+        if signature is not None and signature != self._signature:
+            self._signature = signature
+            self._schedule()
+        elif self._signature is not None and self._worker is None:
+            worker = DerivationWorker(read_synced_records, self._filename, self._signature)
+            worker.signals.finished.connect(lambda records: self._on_synced_loaded(worker, records))
+            worker.signals.failed.connect(lambda error: self._on_synced_loaded(worker, None))
+            self._worker = worker
+            QThreadPool.globalInstance().start(worker)
+
+    def _retire_worker(self):
+        if self._worker is not None:
+            self._retired.add(self._worker)
+            self._worker = None
+
+    def set_manager(self, smart_pass_man, writer=None, signature=None):
+        self._retire_worker()
+        if self.writer is not None and self.writer.on_written == self.note_own_write:
+            self.writer.on_written = None
+
+        self.smart_pass_man = smart_pass_man
+        self.writer = writer
+        self._own_signature = None
+        if writer is not None:
+            writer.on_written = self.note_own_write
+        self.watch(signature)
+
+    def synced_signature(self):
+        # The file state the manager matches, once its pending saves are done.
+        signature = file_signature(self._filename)
+        if signature == self._own_signature:
+            return signature
+        return self._signature
+
+    def _watch_file(self):
+        if self._filename not in self._watcher.files() and os.path.isfile(self._filename):
+            self._watcher.addPath(self._filename)
+
+    def note_own_write(self, records):
+        # Called on the writer thread right after a save.
+        self._own_signature = file_signature(self.smart_pass_man.filename)
+        self._own_written.emit(self._own_signature, records)
+
+    def _on_own_write(self, signature, records):
+        self._signature = signature
+        self._records = records
+
+    def _on_synced_loaded(self, worker, records):
+        if worker is not self._worker:
+            self._retired.discard(worker)
+            return
+        self._worker = None
+        if self._records is None:
+            self._records = records
+
+    def _schedule(self, path=None):
+        self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+        self._watcher.removePaths(self._watcher.files() + self._watcher.directories())
+        self._retire_worker()
+        if self.writer is not None and self.writer.on_written == self.note_own_write:
+            self.writer.on_written = None
+
+    def reload(self):
+        if str(self.smart_pass_man.filename) != self._filename:
+            self.watch()
+            return
+
+        self._watch_file()
+        signature = file_signature(self._filename)
+        if signature is None or signature == self._signature:
+            return
+        if signature == self._own_signature:
+            self._signature = signature
+            return
+        if self._worker is not None:
+            self._timer.start()
+            return
+
+        filename = self._filename
+        if self._records is not None:
+            worker = DerivationWorker(diff_records, self._records, filename)
+        elif self.writer is not None and self.writer.pending:
+            # Nothing to tell local edits apart from until the first save.
+            self._timer.start()
+            return
+        else:
+            # Without pending edits the manager still matches the file.
+            passwords = snapshot_passwords(self.smart_pass_man.passwords)
+            worker = DerivationWorker(lambda: diff_records(record_map(passwords), filename))
+        own_signature = self._own_signature
+        worker.signals.finished.connect(lambda result: self._on_loaded(worker, signature, own_signature, *result))
+        worker.signals.failed.connect(lambda error: self._on_failed(worker, error))
+        self._worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_loaded(self, worker, signature, own_signature, diff, records):
+        if worker is not self._worker:
+            self._retired.discard(worker)
+            return
+        self._worker = None
+
+        self._signature = signature
+        self._records = records
+        # A save that was running or due during the diff writes a snapshot
+        # without these changes, so they are saved once more.
+        rewrite = self._own_signature != own_signature or (self.writer is not None and self.writer.pending)
+        applied = self._apply(diff, rewrite)
+        if applied:
+            self.changed.emit(applied)
+
+    def _on_failed(self, worker, error):
+        # A tool that writes in place may be caught halfway; its next write
+        # event triggers another attempt.
+        if worker is not self._worker:
+            self._retired.discard(worker)
+            return
+        self._worker = None
+        self.failed.emit(error)
+
+    def _apply(self, diff, rewrite=False):
+        passwords = self.smart_pass_man.passwords
+
+        def unchanged(public_key, previous):
+            smart_password = passwords.get(public_key)
+            return smart_password is not None and (smart_password.description, smart_password.length) == previous
+
+        # The file already holds these values, so nothing is written back
+        # unless a local save may have replaced them.
+        with MetadataBatch(self.smart_pass_man) as batch:
+            added_public_keys = set(batch.add_smart_passwords(diff.added))
+            added = [smart_password for smart_password in diff.added if smart_password.public_key in added_public_keys]
+
+            updated = []
+            for public_key, previous, (description, length) in diff.updated:
+                if unchanged(public_key, previous):
+                    self.smart_pass_man.update_smart_password(public_key, description=description, length=length)
+                    updated.append((public_key, previous, (description, length)))
+
+            removed = []
+            for public_key, previous in diff.removed:
+                if unchanged(public_key, previous):
+                    self.smart_pass_man.delete_smart_password(public_key)
+                    removed.append((public_key, previous))
+            if not rewrite:
+                batch.discard_pending()
+
+        return MetadataDiff(added, updated, removed)
@@ -0,0 +1,46 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import hashlib
+import hmac
+
+from smartpasslib.core.chars import PasswordChars
+
+PASSWORD_CHARS = PasswordChars.all()
+PRIVATE_KEY_STEPS = 30
+PUBLIC_KEY_STEPS = 60
+
+
+def derive_keys(secret):
+    # smartpasslib derives the private key (30 steps) and the public key
+    # (60 steps) with the same hash chain, so one pass yields both.
+    def get_hash(text):
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    all_hash = get_hash(secret)
+    private_key = None
+    for i in range(PUBLIC_KEY_STEPS):
+        if i == PRIVATE_KEY_STEPS:
+            private_key = all_hash
+        all_hash = get_hash(f"{all_hash}:{secret}:{i}")
+    return all_hash, private_key.encode('ascii')
+
+
+def verify_secret(secret, public_key):
+    derived_public_key, private_key = derive_keys(secret)
+    if not hmac.compare_digest(derived_public_key, public_key):
+        return None
+    return private_key
+
+
+def expand_password(private_key, length):
+    # Same expansion as smartpasslib's SmartPasswordGenerator, starting from an
+    # already derived private key instead of the secret phrase.
+    chars = PASSWORD_CHARS
+    result = []
+    counter = 0
+    while len(result) < length:
+        for byte in hashlib.sha256(b'%s:%d' % (private_key, counter)).digest():
+            if len(result) == length:
+                break
+            result.append(chars[byte % len(chars)])
+        counter += 1
+    return ''.join(result)
@@ -0,0 +1,84 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class _CachedKey:
+    __slots__ = ('fingerprint', 'private_key', 'expires_at')
+
+    def __init__(self, fingerprint, private_key, expires_at):
+        self.fingerprint = fingerprint
+        self.private_key = private_key
+        self.expires_at = expires_at
+
+    def zeroize(self):
+        # Best effort: the bytearray is overwritten in place, but Python may
+        # still hold transient copies made while hashing.
+        for i in range(len(self.private_key)):
+            self.private_key[i] = 0
+
+
+class SecretCache:
+    # Short-lived cache of verified derivation state keyed by public key. A
+    # hit costs one HMAC of the secret instead of re-running key derivation.
+
+    def __init__(self, ttl=300, max_entries=32):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._key = os.urandom(32)
+        self._lock = threading.Lock()
+
+    def _fingerprint(self, secret):
+        return hmac.new(self._key, secret.encode('utf-8'), hashlib.sha256).digest()
+
+    def _evict(self, public_key):
+        entry = self._entries.pop(public_key, None)
+        if entry is not None:
+            entry.zeroize()
+
+    def get_private_key(self, public_key, secret):
+        with self._lock:
+            entry = self._entries.get(public_key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._evict(public_key)
+                return None
+            if not hmac.compare_digest(entry.fingerprint, self._fingerprint(secret)):
+                return None
+            self._entries.move_to_end(public_key)
+            return bytes(entry.private_key)
+
+    def put(self, public_key, secret, private_key):
+        with self._lock:
+            self._evict(public_key)
+            self._entries[public_key] = _CachedKey(
+                self._fingerprint(secret),
+                bytearray(private_key),
+                time.monotonic() + self.ttl
+            )
+            while len(self._entries) > self.max_entries:
+                self._evict(next(iter(self._entries)))
+
+    def discard(self, public_key):
+        with self._lock:
+            self._evict(public_key)
+
+    def purge_expired(self):
+        now = time.monotonic()
+        with self._lock:
+            for public_key in [key for key, entry in self._entries.items() if entry.expires_at <= now]:
+                self._evict(public_key)
+
+    def clear(self):
+        with self._lock:
+            for public_key in list(self._entries):
+                self._evict(public_key)
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,103 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+
+
+def default_server_name():
+    # One instance per user and configuration directory.
+    config_dir = str(Path.home() / '.config' / 'smart_password_manager')
+    return f'smart-password-manager-{hashlib.sha1(config_dir.encode()).hexdigest()[:16]}'
+
+
+def send_to_running_instance(arguments, name=None, timeout=500, ack_timeout=10000):
+    # Hands `arguments` to a running instance. Returns True once it has
+    # acknowledged them, False if there is none. Blocking socket calls are
+    # used, so this works before the QApplication exists.
+    #
+    # An instance that is still starting accepts the connection but only
+    # reads it once its event loop runs, so the acknowledgement gets a much
+    # longer wait than the connection. The message is sent once: a resend
+    # would be handled twice.
+    socket = QLocalSocket()
+    socket.connectToServer(name or default_server_name())
+    if not socket.waitForConnected(timeout):
+        return False
+
+    message = json.dumps({'args': list(arguments), 'cwd': os.getcwd()}).encode('utf-8') + b'\n'
+    socket.write(message)
+    if not socket.waitForBytesWritten(timeout):
+        socket.abort()
+        return False
+    acknowledged = socket.waitForReadyRead(ack_timeout) and socket.readAll().data().startswith(b'ok')
+    socket.disconnectFromServer()
+    return acknowledged
+
+
+class SingleInstanceServer(QObject):
+    # Listens for later launches. Each connection carries one JSON line with
+    # the launch arguments, which is acknowledged and then emitted.
+
+    message_received = pyqtSignal(list, str)
+
+    def __init__(self, name=None, parent=None):
+        super().__init__(parent)
+        self.name = name or default_server_name()
+        self._server = QLocalServer(self)
+        self._server.setSocketOptions(QLocalServer.UserAccessOption)
+        self._server.newConnection.connect(self._on_new_connection)
+        self._buffers = {}
+
+    def listen(self):
+        if self._server.listen(self.name):
+            return True
+        if self._server.serverError() != QAbstractSocket.AddressInUseError:
+            return False
+
+        # A live instance keeps the name. Otherwise it is a socket file left
+        # behind by a crash, which can be removed.
+        probe = QLocalSocket()
+        probe.connectToServer(self.name)
+        if probe.waitForConnected(100):
+            probe.disconnectFromServer()
+            return False
+        QLocalServer.removeServer(self.name)
+        return self._server.listen(self.name)
+
+    def close(self):
+        self._server.close()
+
+    def _on_new_connection(self):
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            self._buffers[socket] = b''
+            socket.readyRead.connect(lambda socket=socket: self._on_ready_read(socket))
+            socket.disconnected.connect(lambda socket=socket: self._on_disconnected(socket))
+
+    def _on_ready_read(self, socket):
+        buffer = self._buffers.get(socket, b'') + socket.readAll().data()
+        if b'\n' not in buffer:
+            self._buffers[socket] = buffer
+            return
+
+        self._buffers[socket] = b''
+        line = buffer.split(b'\n', 1)[0]
+        try:
+            message = json.loads(line.decode('utf-8'))
+            arguments = [str(argument) for argument in message.get('args', [])]
+            cwd = str(message.get('cwd', ''))
+        except (ValueError, AttributeError, TypeError):
+            socket.disconnectFromServer()
+            return
+
+        socket.write(b'ok\n')
+        socket.flush()
+        self.message_received.emit(arguments, cwd)
+
+    def _on_disconnected(self, socket):
+        self._buffers.pop(socket, None)
+        socket.deleteLater()
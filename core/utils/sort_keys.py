@@ -0,0 +1,54 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import locale
+
+from core.utils.binary_store import iter_records
+
+
+def collation_key(description):
+    try:
+        return locale.strxfrm(description.casefold())
+    except ValueError:
+        # strxfrm rejects embedded NUL characters.
+        return description.casefold()
+
+
+class SortKeys:
+    # Per-entry collation keys and lengths. They are computed on the first sort
+    # and then kept current, so re-sorting is a C-level sort over dict lookups.
+
+    def __init__(self, smart_pass_man):
+        self.smart_pass_man = smart_pass_man
+        self._descriptions = {}
+        self._lengths = {}
+        self._built = False
+
+    def invalidate(self):
+        self._descriptions = {}
+        self._lengths = {}
+        self._built = False
+
+    def _ensure_built(self):
+        if self._built:
+            return
+        self._built = True
+        for public_key, description, length in iter_records(self.smart_pass_man.passwords):
+            self._descriptions[public_key] = collation_key(description)
+            self._lengths[public_key] = length
+
+    def add(self, public_key, description, length):
+        if self._built:
+            self._descriptions[public_key] = collation_key(description)
+            self._lengths[public_key] = length
+
+    def remove(self, public_key):
+        if self._built:
+            self._descriptions.pop(public_key, None)
+            self._lengths.pop(public_key, None)
+
+    def by_description(self, public_keys, descending=False):
+        self._ensure_built()
+        return sorted(public_keys, key=self._descriptions.__getitem__, reverse=descending)
+
+    def by_length(self, public_keys, descending=False):
+        # Two stable sorts: equal lengths stay in description order.
+        return sorted(self.by_description(public_keys), key=self._lengths.__getitem__, reverse=descending)
@@ -1,5 +1,4 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
-from PyQt5.QtMultimedia import QSound
 from PyQt5.QtCore import QObject, pyqtSignal
 
 
@@ -10,6 +9,7 @@ class SoundManager(QObject):
     def __init__(self):
         super().__init__()
         self._enabled = False
+        self._sound_paths = {}
         self._sounds = {}
 
     def set_enabled(self, enabled: bool):
@@ -23,15 +23,25 @@ class SoundManager(QObject):
     def toggle(self):
         self.set_enabled(not self._enabled)
 
-    def register_sound(self, name: str, sound: QSound):
-        self._sounds[name] = sound
+    def register_sound(self, name: str, path: str):
+        self._sound_paths[name] = path
+        self._sounds.pop(name, None)
 
-    def play(self, name: str = None, sound: QSound = None):
+    def _load_sound(self, name: str):
+        sound = self._sounds.get(name)
+        if sound is None and name in self._sound_paths:
+            from PyQt5.QtMultimedia import QSound
+
+            sound = QSound(self._sound_paths[name])
+            self._sounds[name] = sound
+        return sound
+
+    def play(self, name: str = None, sound=None):
         if not self._enabled:
             return False
 
-        if name and name in self._sounds:
-            self._sounds[name].play()
+        if name and name in self._sound_paths:
+            self._load_sound(name).play()
             return True
         elif sound:
             sound.play()
@@ -0,0 +1,80 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+
+    def __init__(self):
+        self.enabled = False
+        self.origin = time.perf_counter_ns()
+        self.events = []
+        self._depth = 0
+        self._open = {}
+
+    def enable(self):
+        self.enabled = True
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter_ns()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.events.append((name, start, time.perf_counter_ns(), self._depth))
+
+    def record(self, name, start, end=None):
+        if self.enabled:
+            self.events.append((name, start, time.perf_counter_ns() if end is None else end, self._depth))
+
+    def begin(self, name):
+        if self.enabled:
+            self._open[name] = time.perf_counter_ns()
+
+    def end(self, name):
+        start = self._open.pop(name, None)
+        if start is not None:
+            self.record(name, start)
+
+    def report(self):
+        lines = [f"{'Phase':<40} {'Start ms':>10} {'Duration ms':>12}"]
+        for name, start, end, depth in sorted(self.events, key=lambda event: (event[1], event[3])):
+            lines.append(
+                f"{'  ' * depth + name:<40} {(start - self.origin) / 1e6:>10.2f} {(end - start) / 1e6:>12.2f}"
+            )
+        return '\n'.join(lines)
+
+    def chrome_trace(self):
+        pid = os.getpid()
+        tid = threading.get_ident()
+        return {
+            "traceEvents": [
+                {
+                    "name": name,
+                    "cat": "startup",
+                    "ph": "X",
+                    "ts": (start - self.origin) / 1e3,
+                    "dur": (end - start) / 1e3,
+                    "pid": pid,
+                    "tid": tid,
+                }
+                for name, start, end, depth in self.events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write_chrome_trace(self, filename):
+        with open(filename, 'w') as f:
+            json.dump(self.chrome_trace(), f, indent=2)
+
+
+profiler = StartupProfiler()
@@ -0,0 +1,171 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+import os
+import warnings
+from collections import OrderedDict
+from pathlib import Path
+
+from core.utils.atomic_write import atomic_write
+from core.utils.binary_store import default_metadata_path, default_store_path, open_password_manager
+from core.utils.metadata_watcher import file_signature
+from core.utils.write_behind import install_write_behind
+
+DEFAULT_VAULT = 'Default'
+
+
+def default_registry_path():
+    return str(Path.home() / '.config' / 'smart_password_manager' / 'vaults.json')
+
+
+class Vault:
+    # A named metadata file. The manager and its writer exist only while the
+    # vault is open; `signature` is the file state the manager last matched.
+
+    def __init__(self, name, filename=None):
+        self.name = name
+        self.filename = filename
+        self.smart_pass_man = None
+        self.writer = None
+        self.signature = None
+
+    @property
+    def is_open(self):
+        return self.smart_pass_man is not None
+
+
+class VaultRegistry:
+    # Vault names and files are kept in vaults.json. Vaults are parsed on first
+    # open and stay cached; beyond `max_open`, the least recently used
+    # inactive vault is saved and dropped, so memory follows the open vaults.
+
+    # Seconds the GUI thread waits for a vault's pending save.
+    write_timeout = 10.0
+
+    def __init__(self, filename=None, max_open=3):
+        self.filename = filename or default_registry_path()
+        self.max_open = max_open
+        self._vaults = OrderedDict([(DEFAULT_VAULT, Vault(DEFAULT_VAULT))])
+        self._open = OrderedDict()
+        self.active = DEFAULT_VAULT
+        self._load()
+
+    def _load(self):
+        if not os.path.isfile(self.filename):
+            return
+        try:
+            with open(self.filename, 'r') as f:
+                data = json.load(f)
+            for entry in data.get('vaults', []):
+                if entry['name'] != DEFAULT_VAULT:
+                    self._vaults[entry['name']] = Vault(entry['name'], entry['filename'])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            warnings.warn(f"Failed to load vault list from {self.filename}: {e}")
+            return
+        if data.get('active') in self._vaults:
+            self.active = data['active']
+
+    def save(self):
+        data = {
+            'active': self.active,
+            'vaults': [
+                {'name': vault.name, 'filename': vault.filename}
+                for vault in self._vaults.values()
+                if vault.name != DEFAULT_VAULT
+            ],
+        }
+        try:
+            atomic_write(self.filename, lambda f: json.dump(data, f, indent=4))
+        except OSError as e:
+            warnings.warn(f"Failed to save vault list to {self.filename}: {e}")
+
+    def names(self):
+        return list(self._vaults)
+
+    def get(self, name):
+        return self._vaults.get(name)
+
+    @property
+    def current(self):
+        return self._vaults[self.active]
+
+    def name_for_file(self, filename):
+        filename = os.path.abspath(filename)
+        for vault in self._vaults.values():
+            if vault.filename is not None:
+                paths = [vault.filename]
+            else:
+                # The Default vault uses whichever default path it was opened
+                # from, and moves between the two when converted.
+                paths = [default_store_path(), default_metadata_path()]
+                if vault.is_open:
+                    paths.append(vault.smart_pass_man.filename)
+            if filename in (os.path.abspath(path) for path in paths):
+                return vault.name
+        return None
+
+    def add(self, name, filename):
+        # The vault is opened before it is listed, so a file that cannot be
+        # read is never saved to vaults.json.
+        if name in self._vaults:
+            raise ValueError(f'A vault named "{name}" already exists')
+        self._vaults[name] = Vault(name, str(filename))
+        try:
+            vault = self.open(name)
+        except (OSError, ValueError):
+            del self._vaults[name]
+            raise
+        self._evict()
+        self.save()
+        return vault
+
+    def remove(self, name):
+        # Only forgets the vault; its metadata file is left in place.
+        if name == DEFAULT_VAULT or name == self.active:
+            raise ValueError(f'The vault "{name}" cannot be removed')
+        vault = self._vaults.pop(name, None)
+        if vault is not None:
+            self._close(vault)
+            self.save()
+
+    def open(self, name):
+        vault = self._vaults[name]
+        if not vault.is_open:
+            vault.signature = file_signature(vault.filename) if vault.filename else None
+            try:
+                vault.smart_pass_man = open_password_manager(vault.filename)
+            except (KeyError, TypeError, AttributeError) as e:
+                # Valid JSON in another shape, such as an export.
+                raise ValueError(f'{vault.filename or "The metadata file"} is not a password metadata file') from e
+            if vault.filename is None:
+                vault.signature = file_signature(vault.smart_pass_man.filename)
+            vault.writer = install_write_behind(vault.smart_pass_man)
+        self._open[name] = vault
+        self._open.move_to_end(name)
+        return vault
+
+    def activate(self, name):
+        vault = self.open(name)
+        self.active = name
+        self._evict()
+        self.save()
+        return vault
+
+    def _evict(self):
+        inactive = [name for name in self._open if name != self.active]
+        while len(self._open) > self.max_open and inactive:
+            self._close(self._vaults[inactive.pop(0)])
+
+    def _close(self, vault):
+        self._open.pop(vault.name, None)
+        if vault.writer is not None:
+            vault.writer.close(self.write_timeout)
+        vault.smart_pass_man = None
+        vault.writer = None
+        vault.signature = None
+
+    def open_vaults(self):
+        return list(self._open)
+
+    def close(self):
+        for vault in list(self._open.values()):
+            self._close(vault)
@@ -0,0 +1,112 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import atexit
+import threading
+import time
+import warnings
+
+from core.utils.binary_store import record_map, snapshot_passwords, write_passwords
+
+
+class WriteBehindWriter:
+    # Replaces SmartPasswordManager._write_data with a cheap "mark dirty" call.
+    # A background thread coalesces the requests and writes the metadata file
+    # atomically once edits have been quiet for `delay` seconds, or at the
+    # latest `max_delay` seconds after the first unsaved change.
+
+    def __init__(self, smart_pass_man, delay=0.5, max_delay=5.0):
+        self.smart_pass_man = smart_pass_man
+        self.delay = delay
+        self.max_delay = max_delay
+        self.write_count = 0
+        # Optional callable run on the writing thread after every save, with
+        # the saved (description, length) per public key.
+        self.on_written = None
+        self._condition = threading.Condition()
+        self._dirty = False
+        self._writing = False
+        self._closed = False
+        self._first_request = 0.0
+        self._last_request = 0.0
+        self._thread = threading.Thread(target=self._run, name='metadata-writer', daemon=True)
+        self._thread.start()
+
+    def _write(self):
+        # The snapshot is taken with GIL-atomic copies, so the GUI thread can
+        # keep editing while it is serialized. Records for the hook are read
+        # first: an edit made during the write can only make the file newer.
+        passwords = snapshot_passwords(self.smart_pass_man.passwords)
+        on_written = self.on_written
+        records = record_map(passwords) if on_written is not None else None
+        if write_passwords(self.smart_pass_man.filename, passwords) and on_written is not None:
+            on_written(records)
+
+    def schedule(self):
+        with self._condition:
+            if self._closed:
+                self._write()
+                return
+            now = time.monotonic()
+            if not self._dirty:
+                self._dirty = True
+                self._first_request = now
+            self._last_request = now
+            self._condition.notify()
+
+    def _due_in(self):
+        now = time.monotonic()
+        return min(self._last_request + self.delay, self._first_request + self.max_delay) - now
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._dirty and not self._closed:
+                    self._condition.wait()
+                if not self._dirty:
+                    return
+                while not self._closed:
+                    remaining = self._due_in()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                self._dirty = False
+                self._writing = True
+
+            # The thread has to outlive a failed save, or every later flush
+            # would wait for it forever.
+            try:
+                self._write()
+            except Exception as e:
+                warnings.warn(f"Failed to save passwords to {self.smart_pass_man.filename}: {e}")
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self.write_count += 1
+                    self._condition.notify_all()
+
+    @property
+    def pending(self):
+        with self._condition:
+            return self._dirty or self._writing
+
+    def flush(self, timeout=None):
+        with self._condition:
+            if self._dirty:
+                self._first_request = 0.0
+                self._condition.notify_all()
+            return self._condition.wait_for(lambda: not self._dirty and not self._writing, timeout)
+
+    def close(self, timeout=None):
+        # Dropping the exit hook also lets a closed writer and its manager be
+        # garbage collected.
+        atexit.unregister(self.close)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+
+def install_write_behind(smart_pass_man, delay=0.5, max_delay=5.0):
+    writer = WriteBehindWriter(smart_pass_man, delay=delay, max_delay=max_delay)
+    smart_pass_man._write_data = writer.schedule
+    atexit.register(writer.close)
+    return writer